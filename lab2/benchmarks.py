@@ -0,0 +1,343 @@
+"""Заміри швидкодії та точності обчислень лабораторної роботи 2.
+
+Запуск: python benchmarks.py [назва заміру ...]
+"""
+import sys
+import time
+import warnings
+from fractions import Fraction
+from math import comb
+
+import numpy as np
+
+from bezier import (BEZIER_METHODS, FLATNESS_PIXELS, accumulated_t_values, adaptive_t_values, bernstein,
+                    bernstein_column, bernstein_table, bezier_curve, bezier_points, clear_bernstein_cache,
+                    de_casteljau, evaluate_bezier, evaluate_bezier_batch, resolve_method, t_values)
+from curve_store import CurveStore
+from picking import PointIndex
+
+
+def measure(func, repeat=3):
+    """Повертає найменший час виконання func (с) та результат останнього виклику."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def random_control_points(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-10, 10, count).tolist(), rng.uniform(-10, 10, count).tolist()
+
+
+def parametric_loop(x, y, step):
+    """Попередній варіант parametric_curve_draw: сума bernstein(n, i, t) для кожного t окремо."""
+    n = len(x) - 1
+    curve_x, curve_y = [], []
+    for t in [i * step for i in range(int(1 / step) + 1)]:
+        curve_x.append(sum(bernstein(n, i, t) * x[i] for i in range(n + 1)))
+        curve_y.append(sum(bernstein(n, i, t) * y[i] for i in range(n + 1)))
+    return np.column_stack((curve_x, curve_y))
+
+
+def bench_parametric():
+    """Параметрична крива Безьє: цикл з bernstein проти кешованої матриці Бернштейна."""
+    print(f"{'точок':>6} {'крок':>7} {'цикл, с':>9} {'матриця, с':>11} {'з кешем, с':>11} "
+          f"{'прискорення':>12} {'макс. похибка':>14}")
+    for count, step in ((5, 0.01), (20, 0.001), (50, 0.0001)):
+        x, y = random_control_points(count)
+        loop_time, expected = measure(lambda: parametric_loop(x, y, step), repeat=1)
+
+        def uncached():
+            clear_bernstein_cache()
+            return bezier_points(x, y, step)
+
+        matrix_time, points = measure(uncached)
+        cached_time, _ = measure(lambda: bezier_points(x, y, step))
+        error = np.abs(points - expected).max()
+        # Перевірка точності: збіг з попереднім способом у межах округлення
+        assert np.allclose(points, expected, rtol=1e-12, atol=1e-9), error
+        print(f"{count:>6} {step:>7} {loop_time:>9.3f} {matrix_time:>11.4f} {cached_time:>11.5f} "
+              f"{loop_time / cached_time:>11.0f}x {error:>14.2e}")
+
+
+def bench_de_casteljau():
+    """Крива Безьє методом De Casteljau: рекурсія для кожного t проти масиву з усіма t."""
+    print(f"{'точок':>6} {'крок':>7} {'рекурсія, с':>12} {'масив, с':>9} {'прискорення':>12} {'збіг':>5}")
+    for count, step in ((5, 0.001), (50, 0.001), (200, 0.001), (500, 0.01), (2000, 0.01)):
+        x, y = random_control_points(count)
+        t = accumulated_t_values(step)
+        try:
+            recursive_time, expected = measure(lambda: np.array([bezier_curve(x, y, value) for value in t]),
+                                               repeat=1)
+        except RecursionError:
+            recursive_time, expected = None, None
+        batched_time, points = measure(lambda: de_casteljau(x, y, t))
+        if expected is None:
+            print(f"{count:>6} {step:>7} {'RecursionError':>12} {batched_time:>9.4f} {'-':>12} {'-':>5}")
+            continue
+        same = np.array_equal(points, expected)
+        print(f"{count:>6} {step:>7} {recursive_time:>12.3f} {batched_time:>9.4f} "
+              f"{recursive_time / batched_time:>11.0f}x {'так' if same else 'ні':>5}")
+
+
+def exact_bezier(x, y, t_values):
+    """Точні значення кривої в раціональній арифметиці (для перевірки точності)."""
+    n = len(x) - 1
+    x = [Fraction(value) for value in x]
+    y = [Fraction(value) for value in y]
+    points = []
+    for t in t_values:
+        t = Fraction(t)
+        basis = [comb(n, i) * t ** i * (1 - t) ** (n - i) for i in range(n + 1)]
+        points.append((float(sum(b * v for b, v in zip(basis, x))), float(sum(b * v for b, v in zip(basis, y)))))
+    return np.array(points)
+
+
+def bench_stability():
+    """Точність і швидкість способів обчислення параметричної кривої для степенів до 2000."""
+    # Крок 1/16 дає точні двійкові значення t, тож похибка - лише від способу обчислення
+    exact_step, step = 1 / 16, 0.001
+    print(f"{'степінь':>8} {'auto':>13} " + " ".join(f"{f'{name}: похибка / с':>26}" for name in BEZIER_METHODS))
+    for degree in (10, 100, 500, 1000, 1029, 1030, 2000):
+        x, y = random_control_points(degree + 1)
+        expected = exact_bezier(x, y, np.arange(17) * exact_step)
+        cells = []
+        for method in BEZIER_METHODS:
+            if resolve_method(method, degree) != method:
+                # Спосіб замінюється іншим, його результат - у стовпці того способу
+                cells.append(f"{'-> ' + resolve_method(method, degree):>23}")
+                continue
+            clear_bernstein_cache()
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                error = np.abs(bezier_points(x, y, exact_step, method) - expected).max()
+                elapsed, _ = measure(lambda: bezier_points(x, y, step, method), repeat=1)
+            cells.append(f"{error:>12.1e} / {elapsed:>8.4f}")
+        print(f"{degree:>8} {resolve_method('auto', degree):>13} " + " ".join(f"{cell:>26}" for cell in cells))
+
+
+def polyline_deviation(curve, t, dense_t, dense):
+    """Найбільша відстань точок щільно обчисленої кривої до відрізків ламаної curve (вершини в t)."""
+    segment = np.clip(np.searchsorted(t, dense_t, side='right') - 1, 0, len(t) - 2)
+    start, chord = curve[segment], curve[segment + 1] - curve[segment]
+    length_sq = np.where((chord ** 2).sum(axis=1) > 0, (chord ** 2).sum(axis=1), 1)
+    u = np.clip(((dense - start) * chord).sum(axis=1) / length_sq, 0, 1)
+    return np.hypot(*(dense - start - u[:, None] * chord).T).max()
+
+
+def bench_adaptive():
+    """Рівномірний крок проти адаптивного поділу: кількість точок, час побудови і відхилення в пікселях."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(10, 8), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.add_subplot(111)
+    print(f"{'точок':>6} {'спосіб':>14} {'вершин':>7} {'обчисл., мс':>12} {'draw, мс':>9} {'відхил., пікс.':>15}")
+    for count in (4, 10, 30):
+        x, y = random_control_points(count)
+        axes.clear()
+        axes.set_xlim(-11, 11)
+        axes.set_ylim(-11, 11)
+        line, = axes.plot([], [])
+        scale = np.array([axes.bbox.width / 22, axes.bbox.height / 22])
+        dense_t = np.linspace(0, 1, 200001)
+        dense = de_casteljau(x, y, dense_t) * scale
+        variants = [(f"крок {step}", lambda step=step: accumulated_t_values(step)) for step in (0.05, 0.0001)]
+        variants.append(("адаптивно", lambda: adaptive_t_values(x, y, FLATNESS_PIXELS, scale)))
+        for name, make_t in variants:
+            compute_time, (t, points) = measure(lambda: (lambda t: (t, de_casteljau(x, y, t)))(make_t()))
+            line.set_data(points[:, 0], points[:, 1])
+            draw_time, _ = measure(canvas.draw)
+            error = polyline_deviation(points * scale, t, dense_t, dense)
+            print(f"{count:>6} {name:>14} {len(t):>7} {compute_time * 1000:>12.2f} {draw_time * 1000:>9.1f} "
+                  f"{error:>15.3f}")
+
+
+def bench_drag():
+    """Рух миші при перетягуванні точки кривої зі 100 точок: повна перебудова проти зсуву на delta * B_i(t)."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(10, 8), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.add_subplot(111)
+    x, y = random_control_points(100)
+    step, point, moves = 0.0001, 37, 20
+    axes.set_xlim(-12, 12)
+    axes.set_ylim(-12, 12)
+
+    def full():
+        # Попередній порядок: нова крива обома способами, нові лінії, легенда і повне малювання
+        lines = []
+        for _ in range(moves):
+            x[point] += 0.01
+            for line in lines:
+                line.remove()
+            first = de_casteljau(x, y, accumulated_t_values(step))
+            second = bezier_points(x, y, step)
+            lines = [axes.plot(first[:, 0], first[:, 1], label="a")[0],
+                     axes.plot(second[:, 0], second[:, 1], label="b")[0]]
+            axes.legend()
+            canvas.draw()
+        for line in lines:
+            line.remove()
+
+    full_time, _ = measure(full, repeat=1)
+
+    t = t_values(step)
+    curve = bezier_points(x, y, step)
+    line, = axes.plot(curve[:, 0], curve[:, 1], animated=True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(axes.bbox)
+    column = bernstein_column(len(x) - 1, point, t)
+
+    def incremental():
+        for _ in range(moves):
+            x[point] += 0.01
+            curve[:, 0] += 0.01 * column
+            line.set_data(curve[:, 0], curve[:, 1])
+            canvas.restore_region(background)
+            axes.draw_artist(line)
+
+    incremental_time, _ = measure(incremental, repeat=1)
+    error = np.abs(curve - bezier_points(x, y, step)).max()
+    print(f"повна перебудова: {full_time / moves * 1000:8.1f} мс/рух")
+    print(f"зсув і блітинг:   {incremental_time / moves * 1000:8.1f} мс/рух "
+          f"({full_time / incremental_time:.0f}x), розбіжність з повним обчисленням {error:.1e}")
+
+
+def bench_picking():
+    """Вибір контрольної точки: перебір усіх точок проти хеш-сітки PointIndex."""
+    print(f"{'точок':>8} {'побудова, с':>12} {'перебір, мкс':>13} {'індекс, мкс':>12} {'збіг':>5}")
+    rng = np.random.default_rng(0)
+    scale = (20.0, 20.0)
+    for count in (1_000, 10_000, 100_000):
+        # Точки кількох сотень кривих на площині 1000 x 1000
+        points = rng.uniform(0, 1000, (count, 2)).tolist()
+        queries = rng.uniform(0, 1000, (200, 2)).tolist()
+        index = PointIndex()
+
+        def build():
+            index.clear()
+            for number, (x, y) in enumerate(points):
+                index.add((number // 100, number % 100), x, y)
+
+        build_time, _ = measure(build, repeat=1)
+
+        def linear(x, y, radius=8):
+            best, best_distance = None, radius
+            for number, (px, py) in enumerate(points):
+                distance = ((px - x) ** 2 * scale[0] ** 2 + (py - y) ** 2 * scale[1] ** 2) ** 0.5
+                if distance <= best_distance:
+                    best, best_distance = (number // 100, number % 100), distance
+            return best
+
+        # Точки поруч із відомими, щоб запити щось знаходили
+        near = [(x + 0.1, y - 0.1) for x, y in points[:len(queries)]]
+        linear_time, expected = measure(lambda: [linear(x, y) for x, y in queries + near], repeat=1)
+        index.nearest(0, 0, scale)
+        index_time, found = measure(lambda: [index.nearest(x, y, scale) for x, y in queries + near])
+        total = len(queries) + len(near)
+        print(f"{count:>8} {build_time:>12.3f} {linear_time / total * 1e6:>13.1f} {index_time / total * 1e6:>12.1f} "
+              f"{'так' if found == expected else 'ні':>5}")
+
+
+def bench_curve_store():
+    """Додавання точки з оновленням меж осей: списки з обходом усіх точок проти CurveStore."""
+    print(f"{'точок':>8} {'списки, мкс':>12} {'CurveStore, мкс':>16} {'збіг меж':>9}")
+    rng = np.random.default_rng(0)
+    for count in (1_000, 5_000, 20_000):
+        # Точки рівномірно розподілені між кривими по 50 точок
+        points = rng.uniform(-100, 100, (count, 2)).tolist()
+
+        def lists():
+            # Попередній варіант create_reference_points: межі за всіма точками після кожного додавання
+            curves = []
+            for number, (x, y) in enumerate(points):
+                if number % 50 == 0:
+                    curves.append(([], []))
+                curves[-1][0].append(x)
+                curves[-1][1].append(y)
+                all_x = [x for crv in curves for x in crv[0]]
+                all_y = [y for crv in curves for y in crv[1]]
+                bounds = min(all_x), max(all_x), min(all_y), max(all_y)
+            return bounds
+
+        def store():
+            curves = CurveStore()
+            for number, (x, y) in enumerate(points):
+                if number % 50 == 0:
+                    curves.add_curve()
+                curves.add_point(curves.active, x, y)
+                bounds = curves.bounds()
+            return bounds
+
+        lists_time, expected = measure(lists, repeat=1)
+        store_time, found = measure(store)
+        print(f"{count:>8} {lists_time / count * 1e6:>12.1f} {store_time / count * 1e6:>16.2f} "
+              f"{'так' if found == expected else 'ні':>9}")
+
+
+def bench_batch():
+    """Багато кривих за раз: evaluate_bezier для кожної кривої проти evaluate_bezier_batch."""
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 1, 64)
+    print(f"{'кривих':>8} {'степені':>8} {'по одній, с':>12} {'пакетом, с':>11} {'розбіжність':>12}")
+    for count, degrees in ((100_000, (3,)), (100_000, (1, 2, 3))):
+        sizes = rng.choice(degrees, count) + 1
+        curves = [rng.uniform(-100, 100, (size, 2)) for size in sizes]
+        # Окремі виклики занадто повільні для всіх кривих: час перших 10 000 масштабується
+        sample = curves[:10_000]
+        single_time, single = measure(lambda: [evaluate_bezier(c[:, 0], c[:, 1], t) for c in sample], repeat=1)
+        single_time *= count / len(sample)
+        batch_time, (points, offsets) = measure(lambda: evaluate_bezier_batch(curves, t))
+        error = max(np.abs(points[offsets[k]:offsets[k + 1]] - expected).max() for k, expected in enumerate(single))
+        print(f"{count:>8} {','.join(map(str, degrees)):>8} {single_time:>12.2f} {batch_time:>11.3f} {error:>12.1e}")
+    cubics = rng.uniform(-100, 100, (100_000, 4, 2))
+    array_time, _ = measure(lambda: evaluate_bezier_batch(cubics, t))
+    print(f"100000 кубічних кривих одним масивом (100000 x 4 x 2): {array_time:.3f} с")
+
+
+def bernstein_text_loop(degree, step):
+    """Попередній варіант compute_bernstein: словник за округленим t і текст для QTextEdit."""
+    t_rounded = [round(i * step, 2) for i in range(int(1 / step) + 1)]
+    table = {t: [bernstein(degree, i, t) for i in range(1, degree)] for t in t_rounded}
+    text = ""
+    for t, values in table.items():
+        text += f"t = {t}: {values}\n"
+    return text
+
+
+def bench_bernstein_table():
+    """Таблиця внутрішніх поліномів: словник і текст проти bernstein_table (перший і повторний запит)."""
+    print(f"{'степінь':>8} {'крок':>8} {'словник і текст, с':>19} {'таблиця, с':>11} {'з кешу, мкс':>12}")
+    for degree, step in ((5, 1e-4), (5, 1e-5), (30, 1e-5)):
+        loop_time, _ = measure(lambda: bernstein_text_loop(degree, step), repeat=1)
+        clear_bernstein_cache()
+        first_time, _ = measure(lambda: bernstein_table(degree, step), repeat=1)
+        cached_time, _ = measure(lambda: bernstein_table(degree, step))
+        print(f"{degree:>8} {step:>8g} {loop_time:>19.3f} {first_time:>11.4f} {cached_time * 1e6:>12.1f}")
+
+
+BENCHMARKS = {
+    'parametric': bench_parametric,
+    'de_casteljau': bench_de_casteljau,
+    'stability': bench_stability,
+    'adaptive': bench_adaptive,
+    'drag': bench_drag,
+    'picking': bench_picking,
+    'curve_store': bench_curve_store,
+    'batch': bench_batch,
+    'bernstein_table': bench_bernstein_table,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"== {name}: {BENCHMARKS[name].__doc__}")
+        BENCHMARKS[name]()
@@ -0,0 +1,37 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class BernsteinTableModel(QAbstractTableModel):
+    """Модель таблиці внутрішніх поліномів Бернштейна для QTableView.
+
+    Зберігає лише масиви значень; текст клітинки форматується, коли представлення
+    запитує її для показу, тож навіть мільйони рядків відкриваються одразу.
+    """
+
+    def __init__(self, t, values, degree, parent=None):
+        super().__init__(parent)
+        self._t = t
+        self._values = values
+        self._degree = degree
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._t)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._values.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return f"{self._values[index.row(), index.column()]:.6g}"
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return f"B{section + 1},{self._degree}"
+        return f"t = {self._t[section]:.6g}"
@@ -0,0 +1,299 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+
+def bernstein(n, i, t):
+    return math.comb(n, i) * (t ** i) * ((1 - t) ** (n - i))
+
+
+def bezier_curve(x, y, t):
+    if len(x) == 1:
+        return x[0], y[0]
+
+    new_points_x = []
+    new_points_y = []
+
+    for i in range(len(x) - 1):
+        new_x = (1 - t) * x[i] + t * x[i + 1]
+        new_y = (1 - t) * y[i] + t * y[i + 1]
+        new_points_x.append(new_x)
+        new_points_y.append(new_y)
+
+    return bezier_curve(new_points_x, new_points_y, t)
+
+
+def t_values(step):
+    """Значення параметра 0, step, 2*step, ... (не більше 1), як у циклах побудови кривих."""
+    return np.arange(int(1 / step) + 1) * step
+
+
+def accumulated_t_values(step):
+    """Значення t, що дає цикл «t += step, поки t <= 1», з тим самим накопиченням похибки."""
+    # cumsum додає послідовно, як і цикл, тож значення збігаються до останнього біта
+    t = np.cumsum(np.concatenate(([0.0], np.full(int(1 / step) + 1, step))))
+    return t[t <= 1]
+
+
+# Найбільша кількість елементів робочого масиву De Casteljau (координати x кількість t)
+DE_CASTELJAU_BLOCK = 1 << 20
+
+
+def de_casteljau(x, y, t):
+    """Точки кривої Безьє для всіх значень t ітеративним алгоритмом De Casteljau.
+
+    Робочий масив (2 x кількість точок x t) щоразу зменшується на одну точку на місці,
+    без рекурсії, тож сотні контрольних точок не впираються в обмеження глибини рекурсії.
+    Кожен крок обчислюється як (1 - t) * p[i] + t * p[i + 1], тому результат збігається
+    з bezier_curve. Значення t обробляються блоками, щоб пам'ять не росла з кількістю точок.
+    Повертає масив (кількість t x 2).
+    """
+    control = np.array([x, y], dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    count = control.shape[1]
+    result = np.empty((len(t), 2))
+    block = max(DE_CASTELJAU_BLOCK // (2 * count), 1)
+    for start in range(0, len(t), block):
+        t_block = t[start:start + block]
+        one_minus_t = 1 - t_block
+        points = np.repeat(control[:, :, None], len(t_block), axis=2)
+        scratch = np.empty_like(points)
+        for size in range(count - 1, 0, -1):
+            np.multiply(t_block, points[:, 1:size + 1], out=scratch[:, :size])
+            points[:, :size] *= one_minus_t
+            points[:, :size] += scratch[:, :size]
+        result[start:start + len(t_block)] = points[:, 0].T
+    return result
+
+
+# Способи обчислення точок параметричної кривої; 'auto' обирає за степенем
+BEZIER_METHODS = ('power', 'log', 'de_casteljau')
+# Найбільший степінь для comb(n, i) * t^i * (1 - t)^(n - i): з n = 1030 коефіцієнт уже
+# не вміщується у float (див. python benchmarks.py stability). Для більших степенів
+# 'power' замінюється на 'log', тож OverflowError не виникає в жодному виклику
+POWER_MAX_DEGREE = 1000
+
+
+def resolve_method(method, degree):
+    """Фактичний спосіб обчислення для назви method та степеня кривої degree.
+
+    'auto' та 'power' для степеня понад POWER_MAX_DEGREE дають 'log'.
+    """
+    if method not in ('auto',) + BEZIER_METHODS:
+        raise ValueError(f"Невідомий спосіб обчислення кривої: {method}")
+    if method in ('auto', 'power'):
+        return 'power' if degree <= POWER_MAX_DEGREE else 'log'
+    return method
+
+
+def bernstein_basis(n, t, method='power', columns=None):
+    """Матриця базисних поліномів Бернштейна степеня n для довільних значень t (рядок - t, стовпець - i).
+
+    Елемент [k, i] дорівнює bernstein(n, i, t_k); columns обмежує обчислення вибраними
+    номерами i. При method='log' кожен елемент обчислюється як експонента суми логарифмів
+    (ln C(n, i) через lgamma), тож ні коефіцієнт, ні степені t не переповнюються і не
+    зникають для будь-якого степеня. 'power' для n понад POWER_MAX_DEGREE теж обчислюється так.
+    """
+    if method == 'power' and n > POWER_MAX_DEGREE:
+        method = 'log'
+    t = np.asarray(t, dtype=np.float64)[:, None]
+    i = np.arange(n + 1) if columns is None else np.asarray(columns)
+    if method == 'log':
+        log_comb = np.array([math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1) for k in i])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 0 * ln 0 = 0: крайні поліноми в t = 0 та t = 1 дорівнюють одиниці
+            log_t = np.where(i == 0, 0.0, i * np.log(t))
+            log_one_minus_t = np.where(i == n, 0.0, (n - i) * np.log1p(-t))
+        return np.exp(log_comb + log_t + log_one_minus_t)
+    coefficients = np.array([math.comb(n, k) for k in i], dtype=np.float64)
+    return coefficients * t ** i * (1 - t) ** (n - i)
+
+
+def bernstein_column(n, i, t):
+    """Значення одного базисного полінома B_i степеня n для всіх t (стійким способом для великих n).
+
+    Переміщення контрольної точки i на delta зсуває кожну точку кривої на delta * B_i(t).
+    """
+    return bernstein_basis(n, t, resolve_method('auto', n), columns=[i])[:, 0]
+
+
+# Найбільший сумарний обсяг кешованих матриць Бернштейна, байтів: з малим кроком одна
+# матриця займає сотні мегабайтів, тож кількість записів сама по собі пам'ять не обмежує
+BERNSTEIN_CACHE_BYTES = 64 * 2 ** 20
+_bernstein_cache = OrderedDict()
+
+
+def bernstein_matrix(n, step, method='power'):
+    """Матриця bernstein_basis для t = 0, step, 2*step, ..., кешована для кожного набору параметрів.
+
+    Кеш витісняє найдавніше використані матриці, щойно їх сумарний обсяг перевищує
+    BERNSTEIN_CACHE_BYTES; більші за цю межу матриці не кешуються зовсім.
+    Доступна лише для читання, бо спільна для всіх викликів.
+    """
+    key = (n, step, method)
+    matrix = _bernstein_cache.get(key)
+    if matrix is not None:
+        _bernstein_cache.move_to_end(key)
+        return matrix
+    matrix = bernstein_basis(n, t_values(step), method)
+    matrix.flags.writeable = False
+    if matrix.nbytes <= BERNSTEIN_CACHE_BYTES:
+        _bernstein_cache[key] = matrix
+        total = sum(cached.nbytes for cached in _bernstein_cache.values())
+        while total > BERNSTEIN_CACHE_BYTES:
+            _, old = _bernstein_cache.popitem(last=False)
+            total -= old.nbytes
+    return matrix
+
+
+def clear_bernstein_cache():
+    _bernstein_cache.clear()
+
+
+def bernstein_table(n, step):
+    """Внутрішні поліноми B_1 ... B_(n-1) степеня n для t = 0, step, 2*step, ...
+
+    Повертає пару (t, матриця кількість t x (n - 1)). Значення беруться зі стовпців кешованої
+    bernstein_matrix (стійким способом для великих n), тож повторний запит з тими самими
+    степенем і кроком нічого не обчислює, якщо матриця вміщується в BERNSTEIN_CACHE_BYTES.
+    """
+    return t_values(step), bernstein_matrix(n, step, resolve_method('auto', n))[:, 1:n]
+
+
+# Кількість рядків, що форматуються за один запис при експорті таблиці у CSV
+CSV_CHUNK = 1 << 14
+
+
+def export_bernstein_csv(path, n, step, chunk=CSV_CHUNK):
+    """Записує таблицю bernstein_table(n, step) у файл CSV блоками по chunk рядків.
+
+    Перший стовпець - t, далі B_1 ... B_(n-1); числа записуються з повною точністю.
+    Текст усієї таблиці в пам'яті не будується.
+    """
+    t, table = bernstein_table(n, step)
+    with open(path, 'w', newline='') as file:
+        file.write(','.join(['t'] + [f'B{i}_{n}' for i in range(1, n)]) + '\n')
+        for start in range(0, len(t), chunk):
+            block = np.column_stack((t[start:start + chunk], table[start:start + chunk]))
+            np.savetxt(file, block, fmt='%.17g', delimiter=',')
+
+
+def evaluate_bezier(x, y, t, method='auto'):
+    """Точки кривої Безьє з контрольними точками (x, y) для довільних значень t: масив (кількість t x 2)."""
+    control = np.column_stack((x, y)).astype(np.float64)
+    method = resolve_method(method, len(control) - 1)
+    if method == 'de_casteljau':
+        return de_casteljau(control[:, 0], control[:, 1], t)
+    return bernstein_basis(len(control) - 1, t, method) @ control
+
+
+def bezier_points(x, y, step, method='auto'):
+    """Точки кривої Безьє з контрольними точками (x, y) для t = 0, step, 2*step, ...
+
+    Для 'power' та 'log' обидві координати - один добуток кешованої матриці Бернштейна
+    на контрольні точки, для 'de_casteljau' - ітеративний алгоритм De Casteljau.
+    Повертає масив (кількість t x 2).
+    """
+    control = np.column_stack((x, y)).astype(np.float64)
+    method = resolve_method(method, len(control) - 1)
+    if method == 'de_casteljau':
+        return de_casteljau(control[:, 0], control[:, 1], t_values(step))
+    return bernstein_matrix(len(control) - 1, step, method) @ control
+
+
+def evaluate_bezier_batch(curves, t, method='auto'):
+    """Точки багатьох кривих Безьє для спільних значень t.
+
+    curves - послідовність масивів контрольних точок (m x 2) різної довжини або один
+    масив (кількість кривих x m x 2). Криві групуються за степенем; для кожної групи
+    матриця Бернштейна обчислюється один раз, а всі криві групи - один добуток цієї
+    матриці на контрольні точки, складені в матрицю (n + 1) x (2 * кількість кривих).
+    Повертає пару (points, offsets): точки всіх кривих підряд у вихідному порядку кривих
+    (масив (кількість кривих * кількість t) x 2) і межі offsets, тож точки кривої k -
+    points[offsets[k]:offsets[k + 1]].
+    """
+    t = np.asarray(t, dtype=np.float64)
+    if isinstance(curves, np.ndarray) and curves.ndim == 3:
+        groups = {curves.shape[1] - 1: (np.arange(len(curves)), curves.astype(np.float64, copy=False))}
+    else:
+        degrees = np.array([len(control) - 1 for control in curves])
+        groups = {}
+        for n in np.unique(degrees):
+            indices = np.flatnonzero(degrees == n)
+            groups[int(n)] = indices, np.array([curves[k] for k in indices], dtype=np.float64)
+    count = sum(len(indices) for indices, _ in groups.values())
+    points = np.empty((count, len(t), 2))
+    for n, (indices, control) in groups.items():
+        method_n = resolve_method(method, n)
+        if method_n == 'de_casteljau':
+            for k, curve in zip(indices, control):
+                points[k] = de_casteljau(curve[:, 0], curve[:, 1], t)
+            continue
+        # (кількість кривих x (n + 1) x 2) -> ((n + 1) x 2 * кількість кривих): один виклик BLAS на групу
+        stacked = control.transpose(1, 0, 2).reshape(n + 1, -1)
+        result = (bernstein_basis(n, t, method_n) @ stacked).reshape(len(t), len(indices), 2)
+        points[indices] = result.transpose(1, 0, 2)
+    offsets = np.arange(count + 1) * len(t)
+    return points.reshape(-1, 2), offsets
+
+
+# Допустиме відхилення ламаної від кривої при адаптивному поділі, пікселів
+FLATNESS_PIXELS = 0.5
+# Найбільша глибина поділу: відрізок параметра не коротший за 2^-20
+MAX_SUBDIVISION_DEPTH = 20
+
+
+def _flatness(segments):
+    """Найбільша відстань контрольних точок кожного сегмента (k x m x 2) до його хорди.
+
+    Відстань береться до відрізка, а не до прямої: окіл відрізка опуклий, тож разом
+    з контрольними точками в ньому лежить і вся крива сегмента.
+    """
+    start = segments[:, :1]
+    chord = segments[:, -1:] - start
+    offset = segments - start
+    length_sq = (chord ** 2).sum(axis=2)
+    # Проєкція на хорду, обмежена її кінцями; для виродженої хорди - початкова точка
+    u = np.clip((offset * chord).sum(axis=2) / np.where(length_sq > 0, length_sq, 1), 0, 1)
+    distance = offset - u[..., None] * chord
+    return np.hypot(distance[..., 0], distance[..., 1]).max(axis=1)
+
+
+def _split_half(segments):
+    """Ділить сегменти (k x m x 2) навпіл за t = 1/2 алгоритмом De Casteljau."""
+    points = segments.copy()
+    left = np.empty_like(segments)
+    right = np.empty_like(segments)
+    m = segments.shape[1]
+    for level in range(m):
+        size = m - level
+        left[:, level] = points[:, 0]
+        right[:, size - 1] = points[:, size - 1]
+        points[:, :size - 1] = 0.5 * (points[:, :size - 1] + points[:, 1:size])
+    return left, right
+
+
+def adaptive_t_values(x, y, tolerance, scale=(1.0, 1.0)):
+    """Значення t для ламаної, що відхиляється від кривої Безьє не більше ніж на tolerance.
+
+    Сегмент кривої ділиться навпіл, доки його контрольні точки не лежать ближче за tolerance
+    до хорди (крива - всередині опуклої оболонки контрольних точок, тож і вона тоді близька
+    до хорди). Відстані вимірюються після множення координат на scale, наприклад у пікселях
+    екрана. Усі сегменти одного рівня поділу обробляються разом; прямі ділянки дають дві
+    точки, вигини - стільки, скільки потрібно.
+    """
+    segments = (np.column_stack((x, y)).astype(np.float64) * scale)[None]
+    starts = np.zeros(1)
+    flat_starts = []
+    for depth in range(MAX_SUBDIVISION_DEPTH + 1):
+        flat = _flatness(segments) <= tolerance
+        if depth == MAX_SUBDIVISION_DEPTH:
+            flat[:] = True
+        flat_starts.append(starts[flat])
+        if flat.all():
+            break
+        left, right = _split_half(segments[~flat])
+        segments = np.concatenate((left, right))
+        starts = np.concatenate((starts[~flat], starts[~flat] + 0.5 ** (depth + 1)))
+    return np.append(np.sort(np.concatenate(flat_starts)), 1.0)
@@ -0,0 +1,129 @@
+import numpy as np
+
+# Початкова місткість буфера точок однієї кривої; при заповненні вона подвоюється
+INITIAL_CAPACITY = 16
+
+
+def _empty_bounds():
+    # (x_min, x_max, y_min, y_max) порожньої множини: будь-яка точка її розширює
+    return [np.inf, -np.inf, np.inf, -np.inf]
+
+
+def _extend(bounds, x, y):
+    if x < bounds[0]:
+        bounds[0] = x
+    if x > bounds[1]:
+        bounds[1] = x
+    if y < bounds[2]:
+        bounds[2] = y
+    if y > bounds[3]:
+        bounds[3] = y
+
+
+class CurveStore:
+    """Контрольні точки всіх кривих у суцільних масивах NumPy, без залежності від Qt.
+
+    Кожна крива має власний буфер (місткість x 2), що подвоюється при заповненні, тож
+    додавання точки - амортизовано O(1) незалежно від кількості кривих. Обмежувальний
+    прямокутник кожної кривої та всіх кривих разом оновлюється при додаванні точки;
+    переміщення точки, що лежала на межі, лише позначає прямокутник застарілим, і він
+    перераховується при наступному запиті bounds().
+
+    Масиви з x(), y() та points() - представлення буфера: зміни через move_point
+    у них видно, але після додавання точок їх треба отримати заново.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Видаляє всі криві; активної кривої немає."""
+        self._buffers = []
+        self._counts = []
+        self._bounds = []
+        self._bounds_valid = []
+        self._total_bounds = _empty_bounds()
+        self._total_valid = True
+        self.active = -1  # номер активної кривої, -1 - кривих ще немає
+
+    def __len__(self):
+        return len(self._buffers)
+
+    def point_count(self, curve):
+        return self._counts[curve]
+
+    def add_curve(self):
+        """Додає порожню криву, робить її активною і повертає її номер."""
+        self._buffers.append(np.empty((INITIAL_CAPACITY, 2)))
+        self._counts.append(0)
+        self._bounds.append(_empty_bounds())
+        self._bounds_valid.append(True)
+        self.active = len(self._buffers) - 1
+        return self.active
+
+    def add_point(self, curve, x, y):
+        """Додає точку в кінець кривої curve і повертає її номер."""
+        count = self._counts[curve]
+        buffer = self._buffers[curve]
+        if count == len(buffer):
+            grown = np.empty((2 * len(buffer), 2))
+            grown[:count] = buffer
+            self._buffers[curve] = buffer = grown
+        buffer[count] = x, y
+        self._counts[curve] = count + 1
+        # Нова точка лише розширює прямокутники, тож вони лишаються точними
+        if self._bounds_valid[curve]:
+            _extend(self._bounds[curve], x, y)
+        if self._total_valid:
+            _extend(self._total_bounds, x, y)
+        return count
+
+    def move_point(self, curve, index, x, y):
+        buffer = self._buffers[curve]
+        old_x, old_y = buffer[index]
+        buffer[index] = x, y
+        bounds = self._bounds[curve]
+        if self._bounds_valid[curve]:
+            if old_x in (bounds[0], bounds[1]) or old_y in (bounds[2], bounds[3]):
+                # Точка могла визначати межу - прямокутник треба перерахувати
+                self._bounds_valid[curve] = False
+                self._total_valid = False
+            else:
+                _extend(bounds, x, y)
+        if self._total_valid:
+            _extend(self._total_bounds, x, y)
+
+    def points(self, curve):
+        """Точки кривої: масив (кількість точок x 2), представлення буфера."""
+        return self._buffers[curve][:self._counts[curve]]
+
+    def x(self, curve):
+        return self.points(curve)[:, 0]
+
+    def y(self, curve):
+        return self.points(curve)[:, 1]
+
+    def bounds(self, curve=None):
+        """(x_min, x_max, y_min, y_max) кривої curve або, якщо curve не задано, усіх кривих.
+
+        Для порожньої множини точок повертає None.
+        """
+        if curve is None:
+            if not self._total_valid:
+                self._total_bounds = _empty_bounds()
+                for number in range(len(self._buffers)):
+                    if self._counts[number]:
+                        x_min, x_max, y_min, y_max = self.bounds(number)
+                        _extend(self._total_bounds, x_min, y_min)
+                        _extend(self._total_bounds, x_max, y_max)
+                self._total_valid = True
+            bounds = self._total_bounds
+        else:
+            if not self._bounds_valid[curve]:
+                points = self.points(curve)
+                x_min, y_min = points.min(axis=0)
+                x_max, y_max = points.max(axis=0)
+                self._bounds[curve] = [x_min, x_max, y_min, y_max]
+                self._bounds_valid[curve] = True
+            bounds = self._bounds[curve]
+        return None if bounds[0] > bounds[1] else tuple(float(value) for value in bounds)
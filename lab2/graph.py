@@ -15,8 +15,9 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QLabel, QLineEdit, QMainWindow,
-    QPushButton, QSizePolicy, QWidget)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QLabel,
+    QLineEdit, QMainWindow, QPushButton, QSizePolicy,
+    QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -75,6 +76,19 @@ class Ui_MainWindow(object):
         self.Parametric_curve_but = QPushButton(self.centralwidget)
         self.Parametric_curve_but.setObjectName(u"Parametric_curve_but")
         self.Parametric_curve_but.setGeometry(QRect(1180, 300, 141, 61))
+        self.method_label = QLabel(self.centralwidget)
+        self.method_label.setObjectName(u"method_label")
+        self.method_label.setGeometry(QRect(1030, 380, 81, 31))
+        self.method_comboBox = QComboBox(self.centralwidget)
+        self.method_comboBox.addItem("")
+        self.method_comboBox.addItem("")
+        self.method_comboBox.addItem("")
+        self.method_comboBox.addItem("")
+        self.method_comboBox.setObjectName(u"method_comboBox")
+        self.method_comboBox.setGeometry(QRect(1120, 375, 201, 41))
+        self.adaptive_checkBox = QCheckBox(self.centralwidget)
+        self.adaptive_checkBox.setObjectName(u"adaptive_checkBox")
+        self.adaptive_checkBox.setGeometry(QRect(1030, 430, 291, 31))
         MainWindow.setCentralWidget(self.centralwidget)
 
         self.retranslateUi(MainWindow)
@@ -95,5 +109,11 @@ class Ui_MainWindow(object):
         self.bernstein_button.setText(QCoreApplication.translate("MainWindow", u"Bernstein", None))
         self.NewCurveButton.setText(QCoreApplication.translate("MainWindow", u"Create new curve", None))
         self.Parametric_curve_but.setText(QCoreApplication.translate("MainWindow", u"Parametric", None))
+        self.method_label.setText(QCoreApplication.translate("MainWindow", u"Method:", None))
+        self.method_comboBox.setItemText(0, QCoreApplication.translate("MainWindow", u"Auto (by degree)", None))
+        self.method_comboBox.setItemText(1, QCoreApplication.translate("MainWindow", u"Power (comb * t^i)", None))
+        self.method_comboBox.setItemText(2, QCoreApplication.translate("MainWindow", u"Log-space (stable)", None))
+        self.method_comboBox.setItemText(3, QCoreApplication.translate("MainWindow", u"De Casteljau (stable)", None))
+        self.adaptive_checkBox.setText(QCoreApplication.translate("MainWindow", u"Adaptive (ignore step)", None))
     # retranslateUi
 
@@ -1,32 +1,15 @@
 import sys
-import math
-from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QDialog, QTextEdit, QPushButton
+from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QDialog, QTableView, QPushButton,
+                               QFileDialog, QHeaderView)
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 from graph import Ui_MainWindow
-
-curves = []
-active_curve_index = -1
-
-
-def bernstein(n, i, t):
-    return math.comb(n, i) * (t ** i) * ((1 - t) ** (n - i))
-
-
-def bezier_curve(x, y, t):
-    if len(x) == 1:
-        return x[0], y[0]
-
-    new_points_x = []
-    new_points_y = []
-
-    for i in range(len(x) - 1):
-        new_x = (1 - t) * x[i] + t * x[i + 1]
-        new_y = (1 - t) * y[i] + t * y[i + 1]
-        new_points_x.append(new_x)
-        new_points_y.append(new_y)
-
-    return bezier_curve(new_points_x, new_points_y, t)
+from curve_store import CurveStore
+from bernstein_table import BernsteinTableModel
+from picking import PICK_RADIUS_PIXELS, PointIndex
+from bezier import (BEZIER_METHODS, FLATNESS_PIXELS, accumulated_t_values, adaptive_t_values, bernstein_column,
+                    bernstein_table, bezier_points, de_casteljau, evaluate_bezier, export_bernstein_csv, resolve_method,
+                    t_values)
 
 
 class TriangleAPP(QMainWindow):
@@ -61,20 +44,30 @@ class TriangleAPP(QMainWindow):
 
         # Видаляємо QTimer – тепер оновлення відбувається лише при натисканні кнопок або при переміщенні точок
 
+        # Контрольні точки всіх кривих та номер активної кривої
+        self.store = CurveStore()
+        # Просторовий індекс контрольних точок усіх кривих для вибору точки мишею
+        self.point_index = PointIndex()
+        # Значення t та степінь, з якими побудовано лінії кривих, - для зміщення кривої при перетягуванні точки
+        self.bezier_t = {}
+        self.parametric_t = {}
+        # Стан перетягування: лінії кривих зі стовпцями базису, анімовані елементи та фон для блітингу
+        self.drag_curves = []
+        self.drag_artists = []
+        self.drag_background = None
+
         self.ax.axhline(0, color="black", linewidth=1)
         self.ax.axvline(0, color="black", linewidth=1)
         self.ax.grid(True)
 
     def create_new_curve(self):
         """Створює нову активну криву"""
-        global active_curve_index
-        curves.append(([], []))
-        active_curve_index = len(curves) - 1  # робимо її активною
-        self.ui.error_label.setText(f"Створено нову криву №{active_curve_index + 1}")
+        index = self.store.add_curve()  # нова крива стає активною
+        self.ui.error_label.setText(f"Створено нову криву №{index + 1}")
 
     def create_reference_points(self):
         """Створює точки для кривої"""
-        global active_curve_index
+        active_curve_index = self.store.active
         if active_curve_index == -1:
             self.ui.error_label.setText("Спершу створіть нову криву!")
             return
@@ -84,8 +77,8 @@ class TriangleAPP(QMainWindow):
             y1 = int(self.ui.Y1_lineEdit.text())
 
             # Додаємо точку до активної кривої
-            curves[active_curve_index][0].append(x1)
-            curves[active_curve_index][1].append(y1)
+            point = self.store.add_point(active_curve_index, x1, y1)
+            self.point_index.add((active_curve_index, point), x1, y1)
 
             # Якщо словник для збереження ліній не створено, створюємо його
             if not hasattr(self, 'curve_lines'):
@@ -93,12 +86,10 @@ class TriangleAPP(QMainWindow):
 
             self.update_curve_plot(active_curve_index)
 
-            # Оновлюємо межі графіка за всіма точками усіх кривих
-            all_x = [x for crv in curves for x in crv[0]]
-            all_y = [y for crv in curves for y in crv[1]]
-            if all_x and all_y:
-                self.ax.set_xlim(min(all_x) - 1, max(all_x) + 1)
-                self.ax.set_ylim(min(all_y) - 1, max(all_y) + 1)
+            # Оновлюємо межі графіка за всіма точками усіх кривих (прямокутник підтримує сховище)
+            x_min, x_max, y_min, y_max = self.store.bounds()
+            self.ax.set_xlim(x_min - 1, x_max + 1)
+            self.ax.set_ylim(y_min - 1, y_max + 1)
 
             self.ax.grid(True)
             self.ax.legend()
@@ -108,26 +99,27 @@ class TriangleAPP(QMainWindow):
 
     def bezier_curve_draw(self):
         """Малює криву Безьє для активної множини точок."""
-        global active_curve_index
-        if active_curve_index == -1 or len(curves[active_curve_index][0]) < 2:
+        active_curve_index = self.store.active
+        if active_curve_index == -1 or self.store.point_count(active_curve_index) < 2:
             self.ui.error_label.setText("Додайте хоча б дві точки!")
             return
 
         try:
             color = self.ui.Color_lineEdit.text()
-            step = float(self.ui.step_lineEdit.text())
+            x_points, y_points = self.store.x(active_curve_index), self.store.y(active_curve_index)
+            if self.ui.adaptive_checkBox.isChecked():
+                t = self.adaptive_t_values(x_points, y_points)
+            else:
+                step = float(self.ui.step_lineEdit.text())
 
-            if step <= 0 or step > 1:
-                self.ui.error_label.setText("Крок має бути у межах (0, 1]!")
-                return
+                if step <= 0 or step > 1:
+                    self.ui.error_label.setText("Крок має бути у межах (0, 1]!")
+                    return
+                t = accumulated_t_values(step)
 
-            curve_x, curve_y = [], []
-            t = 0.0
-            while t <= 1:
-                bx, by = bezier_curve(curves[active_curve_index][0], curves[active_curve_index][1], t)
-                curve_x.append(bx)
-                curve_y.append(by)
-                t += step
+            # Усі значення t обчислюються разом, без рекурсії для кожного з них
+            points = de_casteljau(x_points, y_points, t)
+            curve_x, curve_y = points[:, 0], points[:, 1]
 
             if not hasattr(self, 'bezier_lines'):
                 self.bezier_lines = {}
@@ -141,6 +133,7 @@ class TriangleAPP(QMainWindow):
             bezier_line, = self.ax.plot(curve_x, curve_y, color=color,
                                         label=f"Крива Безьє №{active_curve_index + 1}")
             self.bezier_lines[active_curve_index] = bezier_line
+            self.bezier_t[active_curve_index] = (t, len(x_points) - 1)
 
             self.ax.legend()
             self.canvas.draw()
@@ -149,30 +142,29 @@ class TriangleAPP(QMainWindow):
 
     def parametric_curve_draw(self):
         """Малює криву Безьє параметричним способом"""
-        global active_curve_index
-        if active_curve_index == -1 or len(curves[active_curve_index][0]) < 2:
+        active_curve_index = self.store.active
+        if active_curve_index == -1 or self.store.point_count(active_curve_index) < 2:
             self.ui.error_label.setText("Додайте хоча б дві точки!")
             return
 
         try:
             color = self.ui.Color_lineEdit.text()
-            step = float(self.ui.step_lineEdit.text())
-
-            if step <= 0 or step > 1:
-                self.ui.error_label.setText("Крок має бути у межах (0, 1]!")
-                return
-
-            n = len(curves[active_curve_index][0]) - 1
-            t_values = [i * step for i in range(int(1 / step) + 1)]
-
-            curve_x = []
-            curve_y = []
+            x_points, y_points = self.store.x(active_curve_index), self.store.y(active_curve_index)
+            # Обидві координати - один добуток матриці Бернштейна на контрольні точки
+            # (або De Casteljau); 'auto' для великих степенів переходить до стійкого способу
+            method = self.bezier_method()
+            if self.ui.adaptive_checkBox.isChecked():
+                t = self.adaptive_t_values(x_points, y_points)
+                points = evaluate_bezier(x_points, y_points, t, method)
+            else:
+                step = float(self.ui.step_lineEdit.text())
 
-            for t in t_values:
-                x_t = sum(bernstein(n, i, t) * curves[active_curve_index][0][i] for i in range(n + 1))
-                y_t = sum(bernstein(n, i, t) * curves[active_curve_index][1][i] for i in range(n + 1))
-                curve_x.append(x_t)
-                curve_y.append(y_t)
+                if step <= 0 or step > 1:
+                    self.ui.error_label.setText("Крок має бути у межах (0, 1]!")
+                    return
+                t = t_values(step)
+                points = bezier_points(x_points, y_points, step, method)
+            curve_x, curve_y = points[:, 0], points[:, 1]
 
             if not hasattr(self, 'parametric_lines'):
                 self.parametric_lines = {}
@@ -186,15 +178,30 @@ class TriangleAPP(QMainWindow):
             parametric_line, = self.ax.plot(curve_x, curve_y, color=color,
                                             label=f"Парам. Безьє №{active_curve_index + 1}")
             self.parametric_lines[active_curve_index] = parametric_line
+            self.parametric_t[active_curve_index] = (t, len(x_points) - 1)
 
             self.ax.legend()
             self.canvas.draw()
         except ValueError:
             self.ui.error_label.setText("Дані введені некоректно!")
 
+    def pixel_scale(self):
+        """Кількість пікселів на одиницю даних уздовж осей x та y при поточному масштабі."""
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        return self.ax.bbox.width / abs(x_max - x_min), self.ax.bbox.height / abs(y_max - y_min)
+
+    def adaptive_t_values(self, x_points, y_points):
+        """Значення t адаптивного поділу з допуском FLATNESS_PIXELS пікселів при поточному масштабі осей."""
+        return adaptive_t_values(x_points, y_points, FLATNESS_PIXELS, self.pixel_scale())
+
+    def bezier_method(self):
+        """Спосіб обчислення параметричної кривої, обраний у списку (порядок пунктів - як у графічному файлі)."""
+        return (('auto',) + BEZIER_METHODS)[self.ui.method_comboBox.currentIndex()]
+
     def compute_bernstein(self):
         # Перевіряємо, що є хоча б 3 контрольні точки (щоб були внутрішні точки)
-        if not curves or len(curves[-1][0]) < 3:
+        if not len(self.store) or self.store.point_count(len(self.store) - 1) < 3:
             self.ui.error_label.setText(
                 "Потрібно мати принаймні 3 контрольні точки для обчислення внутрішніх поліномів!")
             return
@@ -205,29 +212,21 @@ class TriangleAPP(QMainWindow):
                 self.ui.error_label.setText("Крок має бути у межах (0, 1]!")
                 return
 
-            n_points = len(curves[-1][0])
-            degree = n_points - 1
+            degree = self.store.point_count(len(self.store) - 1) - 1
 
-            t_values = [round(i * step, 2) for i in range(int(1 / step) + 1)]
+            # Уся таблиця - одне векторне обчислення, кешоване для кожної пари (степінь, крок)
+            t, values = bernstein_table(degree, step)
+            model = BernsteinTableModel(t, values, degree)
 
-            bernstein_table = {
-                t: [bernstein(degree, i, t) for i in range(1, n_points - 1)]
-                for t in t_values
-            }
-
-            result_text = f"Внутрішні Bernstein поліноми для кривої №{len(curves)}:\n"
-            for t, values in bernstein_table.items():
-                result_text += f"t = {t}: {values}\n"
-
-            self.show_modal_window("Внутрішні Bernstein поліноми", result_text)
             self.ui.error_label.setText("")
+            self.show_bernstein_table(f"Внутрішні Bernstein поліноми для кривої №{len(self.store)}",
+                                      model, degree, step)
         except ValueError:
             self.ui.error_label.setText("Дані введені некоректно!")
 
     def update_curve_plot(self, index):
         # Отримуємо координати контрольних точок
-        x_points = curves[index][0]
-        y_points = curves[index][1]
+        x_points, y_points = self.store.x(index), self.store.y(index)
 
         # Оновлюємо лінію, що з'єднує контрольні точки
         if hasattr(self, 'curve_lines') and index in self.curve_lines:
@@ -247,7 +246,7 @@ class TriangleAPP(QMainWindow):
         else:
             colors = ['red'] + ['black'] * (len(x_points) - 2) + ['red']
 
-        points = list(zip(x_points, y_points))
+        points = self.store.points(index)
         if hasattr(self, 'control_points_scatter') and index in self.control_points_scatter:
             scatter = self.control_points_scatter[index]
             scatter.set_offsets(points)
@@ -261,8 +260,7 @@ class TriangleAPP(QMainWindow):
         self.canvas.draw_idle()
 
     def clear(self):
-        global active_curve_index, curves
-        if active_curve_index == -1:
+        if self.store.active == -1:
             self.ui.error_label.setText("Спочатку створіть криву!")
             return
 
@@ -286,7 +284,11 @@ class TriangleAPP(QMainWindow):
                 scatter.remove()
             self.control_points_scatter.clear()
 
-        curves.clear()
+        # Після очищення активної кривої немає: нові точки потребують нової кривої
+        self.store.clear()
+        self.point_index.clear()
+        self.bezier_t.clear()
+        self.parametric_t.clear()
 
         if self.ax.get_legend():
             self.ax.get_legend().remove()
@@ -299,68 +301,142 @@ class TriangleAPP(QMainWindow):
         self.ax.set_ylim([y * scale_factor for y in self.ax.get_ylim()])
         self.canvas.draw()
 
-    def show_modal_window(self, title, text):
+    def show_bernstein_table(self, title, model, degree, step):
+        """Показує таблицю поліномів у QTableView: форматуються лише видимі клітинки."""
         dialog = QDialog(self)
         dialog.setWindowTitle(title)
         dialog.setFixedSize(800, 800)
 
         layout = QVBoxLayout()
 
-        text_edit = QTextEdit()
-        text_edit.setText(text)
-        text_edit.setReadOnly(True)
+        table_view = QTableView()
+        table_view.setModel(model)
+        # Однакова висота рядків: представленню не треба вимірювати кожен рядок
+        table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
+        buttons = QHBoxLayout()
+        export_button = QPushButton("Експорт CSV")
+        export_button.clicked.connect(lambda: self.export_bernstein_table(dialog, degree, step))
         close_button = QPushButton("Закрити")
         close_button.clicked.connect(dialog.accept)
+        buttons.addWidget(export_button)
+        buttons.addWidget(close_button)
 
-        layout.addWidget(text_edit)
-        layout.addWidget(close_button)
+        layout.addWidget(table_view)
+        layout.addLayout(buttons)
 
         dialog.setLayout(layout)
         dialog.exec()
 
+    def export_bernstein_table(self, parent, degree, step):
+        """Записує таблицю поліномів у файл CSV блоками рядків."""
+        file_path, _ = QFileDialog.getSaveFileName(parent, "Експортувати таблицю", "", "CSV (*.csv)")
+        if file_path:
+            export_bernstein_csv(file_path, degree, step)
+
     def on_button_press(self, event):
-        global active_curve_index
+        active_curve_index = self.store.active
         if active_curve_index == -1 or event.inaxes is None:
             return
 
         if event.button == 1 and event.dblclick:
-            curves[active_curve_index][0].append(event.xdata)
-            curves[active_curve_index][1].append(event.ydata)
+            point = self.store.add_point(active_curve_index, event.xdata, event.ydata)
+            self.point_index.add((active_curve_index, point), event.xdata, event.ydata)
             self.update_curve_plot(active_curve_index)
         elif event.button == 3:
-            threshold = 1.0  # поріг вибору
-            closest_point = None
-            min_dist = float('inf')
-            for i, (x, y) in enumerate(zip(curves[active_curve_index][0], curves[active_curve_index][1])):
-                dist = ((event.xdata - x) ** 2 + (event.ydata - y) ** 2) ** 0.5
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_point = i
-            if min_dist < threshold:
+            # Найближча точка будь-якої кривої в межах PICK_RADIUS_PIXELS пікселів на екрані
+            picked = self.point_index.nearest(event.xdata, event.ydata, self.pixel_scale(), PICK_RADIUS_PIXELS)
+            if picked is not None:
+                curve_index, closest_point = picked
+                if curve_index != active_curve_index:
+                    # Точка неактивної кривої робить її активною
+                    active_curve_index = self.store.active = curve_index
                 self.dragging_point = closest_point
-                print(f"Вибрана точка для перетягування: {closest_point}")
+                self.ui.error_label.setText(f"Перетягується точка №{closest_point + 1} кривої №{curve_index + 1}")
+                self.start_drag(active_curve_index, closest_point)
             else:
                 self.dragging_point = None
 
+    def start_drag(self, index, point):
+        """Готує перетягування точки: кешує стовпець базису для кожної лінії кривої та фон осей.
+
+        Лінії, що змінюються, стають анімованими, тож фон малюється без них один раз,
+        а далі на кожен рух миші перемальовуються лише вони.
+        """
+        n = self.store.point_count(index) - 1
+        x_points, y_points = self.store.x(index), self.store.y(index)
+        self.drag_curves = []
+        self.drag_artists = [self.curve_lines[index], self.control_points_scatter[index]]
+        for lines, t_values_by_curve, evaluate in (
+                (getattr(self, 'bezier_lines', {}), self.bezier_t, de_casteljau),
+                (getattr(self, 'parametric_lines', {}), self.parametric_t,
+                 # Спосіб узгоджується зі степенем n так само, як при побудові лінії:
+                 # 'power' для великого степеня замінюється стійким 'log'
+                 lambda x, y, t: evaluate_bezier(x, y, t, resolve_method(self.bezier_method(), n)))):
+            if index in lines:
+                line = lines[index]
+                t, degree = t_values_by_curve[index]
+                if degree != n:
+                    # Після побудови лінії до кривої додано точки: зсув стовпцем базису степеня n
+                    # має сенс лише для кривої того самого степеня, тож спершу перераховуємо лінію
+                    points = evaluate(x_points, y_points, t)
+                    line.set_data(points[:, 0], points[:, 1])
+                    t_values_by_curve[index] = (t, n)
+                column = bernstein_column(n, point, t)
+                self.drag_curves.append((line, line.get_xydata().copy(), column))
+                self.drag_artists.append(line)
+        for artist in self.drag_artists:
+            artist.set_animated(True)
+        self.canvas.draw()
+        self.drag_background = self.canvas.copy_from_bbox(self.ax.bbox)
+
     def on_motion(self, event):
-        global active_curve_index
         if not hasattr(self, 'dragging_point') or self.dragging_point is None or event.inaxes is None:
             return
 
-        curves[active_curve_index][0][self.dragging_point] = event.xdata
-        curves[active_curve_index][1][self.dragging_point] = event.ydata
+        active_curve_index = self.store.active
+        points = self.store.points(active_curve_index)
+        dx = event.xdata - points[self.dragging_point, 0]
+        dy = event.ydata - points[self.dragging_point, 1]
+        self.store.move_point(active_curve_index, self.dragging_point, event.xdata, event.ydata)
+        self.point_index.move((active_curve_index, self.dragging_point), event.xdata, event.ydata)
+
+        self.curve_lines[active_curve_index].set_data(points[:, 0], points[:, 1])
+        self.control_points_scatter[active_curve_index].set_offsets(points)
+
+        # Крива лінійна за контрольними точками: зсув точки i на (dx, dy) зсуває кожну
+        # точку кривої на (dx, dy) * B_i(t), тож повторно обчислювати криву не потрібно
+        for line, curve, column in self.drag_curves:
+            curve[:, 0] += dx * column
+            curve[:, 1] += dy * column
+            line.set_data(curve[:, 0], curve[:, 1])
 
-        self.update_curve_plot(active_curve_index)
+        self.canvas.restore_region(self.drag_background)
+        for artist in self.drag_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
 
-        # Якщо крива вже була побудована, оновлюємо її динамічно:
+    def on_release(self, event):
+        if getattr(self, 'dragging_point', None) is None:
+            return
+        self.dragging_point = None
+        for artist in self.drag_artists:
+            artist.set_animated(False)
+        self.drag_curves = []
+        self.drag_artists = []
+        self.drag_background = None
+
+        active_curve_index = self.store.active
+        # Після перетягування криві перебудовуються повністю (адаптивний поділ - для нової форми)
+        redrawn = False
         if hasattr(self, 'bezier_lines') and active_curve_index in self.bezier_lines:
             self.bezier_curve_draw()
+            redrawn = True
         if hasattr(self, 'parametric_lines') and active_curve_index in self.parametric_lines:
             self.parametric_curve_draw()
-
-    def on_release(self, event):
-        self.dragging_point = None
+            redrawn = True
+        if not redrawn:
+            self.canvas.draw()
 
 
 if __name__ == "__main__":
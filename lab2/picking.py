@@ -0,0 +1,75 @@
+import math
+from collections import defaultdict
+
+# Радіус вибору контрольної точки правою кнопкою, пікселів
+PICK_RADIUS_PIXELS = 8
+
+
+class PointIndex:
+    """Просторовий індекс контрольних точок усіх кривих: хеш-сітка квадратних клітинок.
+
+    Ключ точки - пара (номер кривої, номер точки). Додавання і переміщення точки змінюють
+    лише дві клітинки, а пошук переглядає кілька клітинок навколо курсора, тож його час
+    не залежить від загальної кількості точок.
+    """
+
+    def __init__(self, cell_size=1.0):
+        self.cell_size = cell_size
+        self._cells = defaultdict(set)
+        self._points = {}
+
+    def __len__(self):
+        return len(self._points)
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def add(self, key, x, y):
+        self._points[key] = (x, y)
+        self._cells[self._cell(x, y)].add(key)
+
+    def move(self, key, x, y):
+        old_cell = self._cell(*self._points[key])
+        new_cell = self._cell(x, y)
+        if old_cell != new_cell:
+            self._cells[old_cell].discard(key)
+            if not self._cells[old_cell]:
+                del self._cells[old_cell]
+            self._cells[new_cell].add(key)
+        self._points[key] = (x, y)
+
+    def clear(self):
+        self._cells.clear()
+        self._points.clear()
+
+    def rebuild(self, cell_size):
+        """Перерозподіляє всі точки по клітинках нового розміру."""
+        self.cell_size = cell_size
+        self._cells.clear()
+        for key, (x, y) in self._points.items():
+            self._cells[self._cell(x, y)].add(key)
+
+    def nearest(self, x, y, scale, radius=PICK_RADIUS_PIXELS):
+        """Ключ найближчої точки не далі radius пікселів від (x, y) або None.
+
+        scale - кількість пікселів на одиницю даних уздовж осей x та y (з перетворення осей),
+        тож допуск однаковий на екрані за будь-якого масштабу.
+        """
+        radius_x, radius_y = radius / scale[0], radius / scale[1]
+        # Клітинки мають бути сумірні з радіусом пошуку: після зміни масштабу осей
+        # індекс перебудовується один раз, а не переглядає тисячі порожніх клітинок
+        target = max(radius_x, radius_y)
+        if not target / 4 <= self.cell_size <= target * 4:
+            self.rebuild(target)
+
+        cell_x0, cell_y0 = self._cell(x - radius_x, y - radius_y)
+        cell_x1, cell_y1 = self._cell(x + radius_x, y + radius_y)
+        best, best_distance = None, radius
+        for cell_x in range(cell_x0, cell_x1 + 1):
+            for cell_y in range(cell_y0, cell_y1 + 1):
+                for key in self._cells.get((cell_x, cell_y), ()):
+                    point_x, point_y = self._points[key]
+                    distance = math.hypot((point_x - x) * scale[0], (point_y - y) * scale[1])
+                    if distance <= best_distance:
+                        best, best_distance = key, distance
+        return best
@@ -0,0 +1,207 @@
+"""Пакетне обчислення кадрів фракталу sh(z) + c у файли PNG без графічного інтерфейсу.
+
+Запуск: python batch.py параметри.json [-o каталог] [-j процесів] [--skip-existing]
+
+Файл параметрів - об'єкт JSON. Ключі верхнього рівня задають значення для всіх кадрів
+(див. DEFAULTS), "frames" - список кадрів, кожен з яких може перевизначити будь-який ключ,
+"zoom" - послідовність кадрів масштабування до точки:
+
+    {
+        "width": 1920, "height": 1080, "max_iterations": 300, "colormap": "magma",
+        "frames": [
+            {"c": [0.0, 0.0], "view": [-2.5, 2.5, -2.0, 2.0]},
+            {"c": [1.5, 0.2], "center": [0.5, 0.5], "span": 0.25}
+        ],
+        "zoom": {"c": [0.0, 0.0], "center": ["0.31006", "1.00004"],
+                 "span_from": 5.0, "span_to": 1e-20, "frames": 2000}
+    }
+
+Область задається межами "view" [x_min, x_max, y_min, y_max] або центром "center" та
+шириною "span" (висота - за пропорціями кадру). Координати центру можна писати рядками,
+щоб не втрачати знаки; дуже вузькі області рахуються методом збурень (DeepZoomFractal).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal
+
+from colors import colorize, colormap_lut
+from fractal import HyperbolicSinusFractal
+from kernels import resolve_backend
+from perturbation import DeepZoomFractal
+from png_writer import write_png
+
+DEFAULTS = {
+    'width': 800,
+    'height': 600,
+    'max_iterations': 100,
+    'escape_radius': 1000,
+    'colormap': 'viridis',
+    'smooth': False,
+    'precision': 'auto',
+    # Паралельність - між кадрами, тому кожен кадр рахується в одному потоці
+    'backend': 'numpy',
+    'c': [0.0, 0.0],
+    'view': [-2.5, 2.5, -2.0, 2.0],
+}
+
+# Ширина області (відносно модуля центру), нижче якої float64 не розрізняє сусідні пікселі
+DEEP_ZOOM_RELATIVE_SPAN = 1e-12
+
+
+def _merge(base, frame):
+    # Явно задані межі кадру мають перевагу над центром і шириною з ключів верхнього рівня
+    merged = dict(base, **frame)
+    if 'view' in frame:
+        merged.pop('span', None)
+    return merged
+
+
+def expand_frames(params):
+    """Повний список кадрів: кожен кадр - словник з усіма ключами DEFAULTS."""
+    base = dict(DEFAULTS)
+    base.update({key: value for key, value in params.items() if key not in ('frames', 'zoom')})
+
+    frames = [_merge(base, frame) for frame in params.get('frames', [])]
+
+    zoom = params.get('zoom')
+    if zoom is not None:
+        zoom = dict(zoom)
+        missing = [key for key in ('frames', 'span_from', 'span_to') if key not in zoom]
+        if missing:
+            raise ValueError(f"У блоці 'zoom' бракує ключів: {', '.join(missing)}")
+        count = zoom.pop('frames')
+        span_from, span_to = zoom.pop('span_from'), zoom.pop('span_to')
+        for index in range(count):
+            # Геометрична прогресія ширини дає рівномірну швидкість масштабування
+            t = index / max(count - 1, 1)
+            frames.append(_merge(base, dict(zoom, span=span_from * (span_to / span_from) ** t)))
+
+    if not frames:
+        frames.append(base)
+    # Усі кадри перевіряються до початку обчислень: помилка в параметрах зупиняє запуск
+    # одразу, а не посеред довгого пакета
+    for index, frame in enumerate(frames):
+        try:
+            validate_frame(frame)
+        except (KeyError, TypeError, ValueError, ArithmeticError) as error:
+            raise ValueError(f"Кадр {index}: {error}") from error
+    return frames
+
+
+def validate_frame(frame):
+    """Перевіряє параметри кадру без обчислень; для некоректних значень виникає ValueError."""
+    if 'span' in frame and 'center' not in frame:
+        raise ValueError("ширина 'span' задана без центру 'center'")
+    if 'span' not in frame and len(frame['view']) != 4:
+        raise ValueError("'view' має містити межі [x_min, x_max, y_min, y_max]")
+    if len(frame['c']) != 2:
+        raise ValueError("'c' має містити дійсну та уявну частини")
+    if frame['width'] < 1 or frame['height'] < 1 or frame['max_iterations'] < 1:
+        raise ValueError("розміри кадру та кількість ітерацій мають бути додатними")
+    if frame['precision'] not in ('auto', 'double', 'single'):
+        raise ValueError(f"невідома точність: {frame['precision']}")
+    resolve_backend(frame['backend'])
+    try:
+        colormap_lut(frame['colormap'])
+    except KeyError:
+        raise ValueError(f"невідома колірна схема: {frame['colormap']}") from None
+    complex(*frame['c'])
+    make_fractal(frame)
+
+
+def make_fractal(frame):
+    """Створює фрактал з параметрами кадру (звичайний або для глибокого масштабування)."""
+    width, height = frame['width'], frame['height']
+    if 'span' in frame:
+        center_real, center_imag = (Decimal(str(value)) for value in frame['center'])
+        half_w = frame['span'] / 2
+        half_h = half_w * height / width
+        if frame['span'] < DEEP_ZOOM_RELATIVE_SPAN * max(1.0, abs(float(center_real)), abs(float(center_imag))):
+            fractal = DeepZoomFractal(width, height)
+            fractal.center_real, fractal.center_imag = center_real, center_imag
+            fractal.x_min, fractal.x_max = -half_w, half_w
+            fractal.y_min, fractal.y_max = -half_h, half_h
+        else:
+            fractal = HyperbolicSinusFractal(width, height)
+            fractal.x_min, fractal.x_max = float(center_real) - half_w, float(center_real) + half_w
+            fractal.y_min, fractal.y_max = float(center_imag) - half_h, float(center_imag) + half_h
+    else:
+        fractal = HyperbolicSinusFractal(width, height)
+        fractal.x_min, fractal.x_max, fractal.y_min, fractal.y_max = frame['view']
+
+    fractal.max_iterations = frame['max_iterations']
+    fractal.escape_radius = frame['escape_radius']
+    fractal.colormap = frame['colormap']
+    fractal.smooth = frame['smooth']
+    fractal.precision = frame['precision']
+    fractal.backend = frame['backend']
+    return fractal
+
+
+def render_frame(task):
+    """Обчислює один кадр і записує його у PNG (виконується у процесі-виконавці)."""
+    index, frame, path = task
+    # Переповнення sinh для точок, що втекли, очікуване
+    warnings.filterwarnings('ignore', category=RuntimeWarning)
+    start = time.perf_counter()
+    fractal = make_fractal(frame)
+    c_real, c_imag = frame['c']
+    data = fractal.generate(c_real, c_imag)
+    # Рядок 0 масиву - нижній край області (origin='lower' у вікні програми)
+    write_png(path, colorize(data[::-1], fractal.colormap)[..., :3])
+    return index, path, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетне обчислення кадрів фракталу sh(z) + c у PNG")
+    parser.add_argument('params', help="файл параметрів JSON")
+    parser.add_argument('-o', '--output', default='frames', help="каталог для кадрів")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="кількість процесів")
+    parser.add_argument('--pattern', default='frame_{index:05d}.png', help="шаблон імені файлу кадру")
+    parser.add_argument('--skip-existing', action='store_true', help="не перераховувати наявні кадри")
+    args = parser.parse_args(argv)
+
+    with open(args.params, encoding='utf-8') as file:
+        params = json.load(file)
+    try:
+        frames = expand_frames(params)
+    except ValueError as error:
+        parser.error(str(error))
+    os.makedirs(args.output, exist_ok=True)
+
+    tasks = []
+    for index, frame in enumerate(frames):
+        path = os.path.join(args.output, args.pattern.format(index=index))
+        if args.skip_existing and os.path.exists(path):
+            continue
+        tasks.append((index, frame, path))
+    print(f"Кадрів: {len(frames)}, до обчислення: {len(tasks)}, процесів: {args.jobs}")
+
+    start = time.perf_counter()
+    failed = []
+    # Кадри записуються на диск одразу після обчислення, у порядку готовності.
+    # Помилка одного кадру не зупиняє решту: про неї повідомляється, а код виходу стає ненульовим
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(render_frame, task): task[0] for task in tasks}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                index, path, elapsed = future.result()
+            except Exception as error:
+                failed.append(futures[future])
+                print(f"[{done}/{len(tasks)}] кадр {futures[future]}: помилка: {error!r}", file=sys.stderr, flush=True)
+                continue
+            print(f"[{done}/{len(tasks)}] кадр {index}: {path} ({elapsed:.2f} с)", flush=True)
+    print(f"Готово за {time.perf_counter() - start:.1f} с")
+    if failed:
+        print(f"Не вдалося обчислити кадрів: {len(failed)} ({', '.join(map(str, sorted(failed)))})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
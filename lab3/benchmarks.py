@@ -0,0 +1,498 @@
+"""Заміри швидкодії обчислень лабораторної роботи 3.
+
+Запуск: python benchmarks.py [назва заміру ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+from fractal import HyperbolicSinusFractal, escape_time
+from colors import colorize
+from kernels import available_backends
+from perturbation import DeepZoomFractal
+from tiles import TiledRenderer
+from hilbert import (export_binary, export_svg, hilbert_grid_order, hilbert_points, hilbert_window,
+                     lod_order)
+
+
+def measure(func, repeat=3):
+    """Повертає найменший час виконання func (с) та результат останнього виклику."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def make_fractal(width, height, max_iterations, view=None, precision='double'):
+    """Фрактал для замірів; подвійна точність за замовчуванням, щоб результати були порівнянні
+    з float64-обчисленнями (TiledRenderer, DeepZoomFractal, ядро numba)."""
+    fractal = HyperbolicSinusFractal(width, height)
+    fractal.max_iterations = max_iterations
+    fractal.precision = precision
+    if view is not None:
+        fractal.x_min, fractal.x_max, fractal.y_min, fractal.y_max = view
+    return fractal
+
+
+def bench_tiled():
+    """Порівняння HyperbolicSinusFractal.generate з TiledRenderer на однакових параметрах."""
+    print(f"{'розмір':>12} {'ітерацій':>9} {'generate, с':>12} {'плитки, с':>10} {'прискорення':>12} {'збіг':>5}")
+    for width, height, max_iterations in [(800, 600, 100), (2000, 1500, 200), (4000, 4000, 1000)]:
+        fractal = make_fractal(width, height, max_iterations)
+        base_time, expected = measure(lambda: fractal.generate(0.0, 0.0), repeat=1)
+        with TiledRenderer() as renderer:
+            renderer.render(make_fractal(64, 64, 10), 0.0, 0.0)  # запуск процесів
+            tiled_time, actual = measure(lambda: renderer.render(fractal, 0.0, 0.0), repeat=1)
+        print(f"{width:>5}x{height:<6} {max_iterations:>9} {base_time:>12.3f} {tiled_time:>10.3f} "
+              f"{base_time / tiled_time:>11.2f}x {str(np.array_equal(expected, actual)):>5}")
+
+
+def full_grid_escape_time(Z, c, max_iterations, escape_radius, on_iteration=None):
+    """Попередня реалізація циклу: кожна ітерація проходить по всій сітці."""
+    result = np.zeros(Z.shape, dtype=np.int32)
+    Z_temp = np.copy(Z)
+    for i in range(max_iterations):
+        mask_overflow = np.abs(Z_temp) > 700
+        if np.any(mask_overflow):
+            result[mask_overflow & (result == 0)] = i
+            Z_temp[mask_overflow] = np.inf
+        Z_temp = np.sinh(Z_temp) + c
+        mask = (np.abs(Z_temp) > escape_radius) & (result == 0)
+        result[mask] = i
+        if on_iteration is not None and on_iteration(i, np.count_nonzero(result == 0)):
+            break
+    return result
+
+
+def bench_active_set():
+    """Стиснений набір активних точок проти проходу по всій сітці (95% точок втікають за 10 ітерацій)."""
+    c = complex(1.5, 0.2)
+    print(f"{'розмір':>12} {'ітерацій':>9} {'вся сітка, с':>13} {'активні, с':>11} {'прискорення':>12} {'збіг':>5}")
+    for width, height in [(800, 600), (4000, 3000)]:
+        fractal = make_fractal(width, height, 300)
+        x, y = fractal.grid_axes()
+        X, Y = np.meshgrid(x, y)
+        Z = X + 1j * Y
+        min_active = Z.size * 0.01
+        for stop in (lambda i, active: active < min_active, None):
+            full_time, expected = measure(lambda: full_grid_escape_time(Z, c, 300, 1000, stop), repeat=1)
+            active_time, actual = measure(lambda: escape_time(Z, c, 300, 1000, stop), repeat=1)
+            label = "300+1%" if stop else "300"
+            print(f"{width:>5}x{height:<6} {label:>9} {full_time:>13.3f} {active_time:>11.3f} "
+                  f"{full_time / active_time:>11.2f}x {str(np.array_equal(expected, actual)):>5}")
+
+
+def bench_deep_zoom():
+    """Метод збурень проти звичайного обчислення на неглибокому масштабі та час на глибокому.
+
+    На неглибокому масштабі результати мають збігатися точно, інакше замір завершується помилкою.
+    """
+    print(f"{'ширина':>10} {'generate, с':>12} {'збурення, с':>12} {'розбіжність':>12}")
+    for view in [(-2.5, 2.5, -2.0, 2.0), (-0.1, 0.1, 0.9, 1.05)]:
+        fractal = make_fractal(400, 300, 100, view)
+        deep = DeepZoomFractal.from_view(fractal)
+        base_time, expected = measure(lambda: fractal.generate(0.0, 0.0), repeat=1)
+        deep_time, actual = measure(lambda: deep.generate(0.0, 0.0), repeat=1)
+        mismatch = np.mean(expected != actual)
+        print(f"{view[1] - view[0]:>10.3g} {base_time:>12.3f} {deep_time:>12.3f} {mismatch:>11.2%}")
+        # Перевірка регресії: на неглибокому масштабі обидва способи в подвійній точності
+        # мають давати однаковий результат до пікселя
+        if not np.array_equal(expected, actual):
+            raise AssertionError(f"DeepZoomFractal розходиться з generate для ширини {view[1] - view[0]:g}: "
+                                 f"{mismatch:.2%} пікселів")
+    for span in (1e-20, 1e-60):
+        deep = DeepZoomFractal.from_view(make_fractal(400, 300, 100, (-0.1, 0.1, 0.9, 1.05)))
+        deep.set_view(-span, span, -span * 0.75, span * 0.75)
+        deep_time, _ = measure(lambda: deep.generate(0.0, 0.0), repeat=1)
+        print(f"{2 * span:>10.3g} {'-':>12} {deep_time:>12.3f} {'-':>12}")
+
+
+def bench_backends():
+    """Ядра циклу втечі (numpy, numba) у HyperbolicSinusFractal.generate."""
+    backends = available_backends()
+    if 'numba' in backends:
+        # Перший виклик компілює ядро (або читає його з кешу), це не входить у заміри
+        warmup = make_fractal(64, 64, 10)
+        warmup.backend = 'numba'
+        warmup.generate(0.0, 0.0)
+    print(f"{'розмір':>12} {'ітерацій':>9} " + " ".join(f"{name + ', с':>10}" for name in backends)
+          + f" {'прискорення':>12} {'розбіжність':>12}")
+    for width, height in [(640, 480), (1280, 960), (2560, 1920)]:
+        for max_iterations in (50, 200):
+            fractal = make_fractal(width, height, max_iterations)
+            times, results = [], []
+            for name in backends:
+                fractal.backend = name
+                elapsed, result = measure(lambda: fractal.generate(0.0, 0.0), repeat=1)
+                times.append(elapsed)
+                results.append(result)
+            mismatch = max(np.mean(results[0] != result) for result in results)
+            print(f"{width:>5}x{height:<6} {max_iterations:>9} " + " ".join(f"{t:>10.3f}" for t in times)
+                  + f" {times[0] / times[-1]:>11.2f}x {mismatch:>11.4%}")
+
+
+def bench_smooth():
+    """Плавне забарвлення: час, пам'ять результату та кількість різних рівнів (менше - помітніші смуги)."""
+    print(f"{'ітерацій':>9} {'режим':>16} {'час, с':>8} {'МБ':>6} {'рівнів':>8}")
+    for max_iterations in (25, 100, 400):
+        for smooth, dtype in [(False, np.float64), (True, np.float64), (True, np.float32)]:
+            fractal = make_fractal(800, 600, max_iterations)
+            fractal.backend = 'numpy'
+            fractal.smooth = smooth
+            fractal.dtype = dtype
+            elapsed, result = measure(lambda: fractal.generate(0.0, 0.0), repeat=1)
+            mode = ("плавний " if smooth else "цілий ") + np.dtype(dtype).name
+            levels = np.unique(result[result > 0]).size
+            print(f"{max_iterations:>9} {mode:>16} {elapsed:>8.3f} {result.nbytes / 2 ** 20:>6.1f} {levels:>8}")
+
+
+def bench_precision():
+    """Одинарна точність (complex64) проти подвійної: час, пам'ять і частка пікселів, що розходяться."""
+    print(f"{'c':>10} {'ширина':>8} {'auto':>7} {'double, с':>10} {'single, с':>10} {'прискорення':>12} "
+          f"{'МБ':>11} {'розбіжність':>12}")
+    views = [(-2.5, 2.5, -2.0, 2.0), (0.3, 0.8, 0.2, 0.575), (-30.0, 30.0, -22.5, 22.5),
+             (1.2, 1.2 + 1e-4, 0.3, 0.3 + 7.5e-5)]
+    for c in (complex(0.0, 0.0), complex(1.5, 0.2), complex(-0.3, 1.0)):
+        for view in views:
+            fractal = make_fractal(800, 600, 200, view, precision='auto')
+            fractal.backend = 'numpy'
+            auto = 'single' if fractal.single_precision() else 'double'
+            results = {}
+            for precision in ('double', 'single'):
+                fractal.precision = precision
+                elapsed, result = measure(lambda: fractal.generate(c.real, c.imag), repeat=1)
+                results[precision] = (elapsed, result)
+            (double_time, expected), (single_time, actual) = results['double'], results['single']
+            # Порівнюємо номери ітерацій: нормалізовані значення float32 і float64 відрізняються округленням
+            mismatch = np.mean(np.rint(expected * 200) != np.rint(actual * 200))
+            memory = f"{expected.nbytes / 2 ** 20:.1f}/{actual.nbytes / 2 ** 20:.1f}"
+            print(f"{c.real:>+5.1f}{c.imag:>+5.1f}i {view[1] - view[0]:>8.2g} {auto:>7} {double_time:>10.3f} "
+                  f"{single_time:>10.3f} {double_time / single_time:>11.2f}x {memory:>11} {mismatch:>11.4%}")
+
+
+def bench_display():
+    """Час кадру: обчислення, кольори через таблицю у буфер QImage і виведення проти imshow + draw."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtCore import QRectF
+    from PySide6.QtGui import QGuiApplication, QImage, QPainter
+    # QPainter потребує екземпляра застосунку, поки малює
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])
+
+    print(f"{'розмір':>12} {'обчислення, с':>14} {'кольори, с':>11} {'QImage, с':>10} {'imshow+draw, с':>15}")
+    for size in (1000, 2000, 4000):
+        # Як у застосунку: точність обирається за кроком пікселя
+        fractal = make_fractal(size, size, 100, view=(-2.5, 2.5, -2.5, 2.5), precision='auto')
+        compute_time, data = measure(lambda: fractal.generate(0.0, 0.0), repeat=1)
+
+        pixels = np.empty((size, size, 4), dtype=np.uint8)
+        image = QImage(pixels.data, size, size, size * 4, QImage.Format_RGBA8888)
+        colorize_time, _ = measure(lambda: colorize(data[::-1], fractal.colormap, out=pixels))
+
+        # Вікно перегляду 800x800: зображення масштабується під нього, як у ImageCanvas
+        target = QImage(800, 800, QImage.Format_RGB32)
+
+        def blit():
+            painter = QPainter(target)
+            painter.drawImage(QRectF(0, 0, 800, 800), image)
+            painter.end()
+        blit_time, _ = measure(blit)
+
+        figure = Figure(figsize=(8, 8), dpi=100)
+        canvas = FigureCanvasAgg(figure)
+        axes = figure.add_subplot(111)
+
+        def draw_matplotlib():
+            axes.clear()
+            axes.imshow(data, cmap=fractal.colormap, extent=[fractal.x_min, fractal.x_max,
+                                                             fractal.y_min, fractal.y_max],
+                        origin='lower', aspect='equal')
+            figure.tight_layout()
+            canvas.draw()
+        matplotlib_time, _ = measure(draw_matplotlib)
+
+        print(f"{size:>5}x{size:<6} {compute_time:>14.3f} {colorize_time:>11.3f} {blit_time:>10.3f} "
+              f"{matplotlib_time:>15.3f}")
+
+
+def redraw_times(figure, frames, colormap, present):
+    """Час кадру (с) для нового imshow і для оновлення AxesImage на одній фігурі.
+
+    Осі налаштовуються так само, як у draw_sinh_figure: без поділок, із заголовком, що
+    змінюється на кожному кадрі. present() виводить кадр (draw або draw + перемальовування віджета).
+    """
+    axes = figure.add_subplot(111)
+
+    def rebuild():
+        for step, ((x_min, x_max, y_min, y_max), data) in enumerate(frames):
+            axes.clear()
+            axes.imshow(data, cmap=colormap, extent=[x_min, x_max, y_min, y_max],
+                        origin='lower', aspect='equal')
+            axes.set_title(f"Фрактал sh(z) + c, кадр {step}")
+            axes.set_xticks([])
+            axes.set_yticks([])
+            figure.tight_layout()
+            present()
+
+    def update():
+        for step, ((x_min, x_max, y_min, y_max), data) in enumerate(frames):
+            image.set_data(data)
+            image.set_extent([x_min, x_max, y_min, y_max])
+            image.set_clim(data.min(), data.max())
+            axes.set_xlim(x_min, x_max)
+            axes.set_ylim(y_min, y_max)
+            axes.set_title(f"Фрактал sh(z) + c, кадр {step}")
+            present()
+
+    rebuild_time, _ = measure(rebuild)
+    # Зображення створюється один раз, як у draw_sinh_figure, далі лише оновлюються дані та межі
+    axes.clear()
+    (x_min, x_max, y_min, y_max), data = frames[0]
+    image = axes.imshow(data, cmap=colormap, extent=[x_min, x_max, y_min, y_max], origin='lower', aspect='equal')
+    axes.set_xticks([])
+    axes.set_yticks([])
+    axes.set_title("Фрактал sh(z) + c, кадр 0")
+    figure.tight_layout()
+    present()
+    update_time, _ = measure(update)
+    return rebuild_time / len(frames), update_time / len(frames), axes
+
+
+def bench_redraw():
+    """Перемальовування 800x600 при повторних масштабуваннях: новий imshow проти оновлення AxesImage."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    fractal = make_fractal(800, 600, 100)
+    frames = []
+    for step in range(10):
+        # Послідовність наближень до точки (0.5, 0.5), як при адаптивному масштабуванні
+        half = 2.5 * 0.8 ** step
+        view = (0.5 - half, 0.5 + half, 0.5 - 0.8 * half, 0.5 + 0.8 * half)
+        data = np.random.default_rng(step).random((600, 800))
+        frames.append((view, data))
+
+    figure = Figure(figsize=(8, 7), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    rebuild_time, update_time, axes = redraw_times(figure, frames, fractal.colormap, canvas.draw)
+    print(f"Agg, новий imshow:        {rebuild_time * 1000:8.2f} мс/кадр")
+    print(f"Agg, set_data/extent:     {update_time * 1000:8.2f} мс/кадр ({rebuild_time / update_time:.2f}x)")
+
+    # Полотно Qt, як FractalCanvas у вікні застосунку: draw і синхронне перемальовування віджета
+    qt_figure = Figure(figsize=(8, 7), dpi=100)
+    qt_canvas = FigureCanvasQTAgg(qt_figure)
+    qt_canvas.resize(800, 700)
+    qt_canvas.show()
+
+    def present_qt():
+        qt_canvas.draw()
+        qt_canvas.repaint()
+
+    qt_rebuild, qt_update, _ = redraw_times(qt_figure, frames, fractal.colormap, present_qt)
+    print(f"Qt, новий imshow:         {qt_rebuild * 1000:8.2f} мс/кадр")
+    print(f"Qt, set_data/extent:      {qt_update * 1000:8.2f} мс/кадр ({qt_rebuild / qt_update:.2f}x)")
+    qt_canvas.close()
+
+    text = axes.text(0.01, 0.01, "", transform=axes.transAxes, animated=True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(figure.bbox)
+
+    def readout():
+        for step in range(100):
+            canvas.restore_region(background)
+            text.set_text(f"X: {step:.4f} Y: {step:.4f}")
+            axes.draw_artist(text)
+
+    readout_time, _ = measure(readout)
+    draw_time, _ = measure(canvas.draw)
+    print(f"підпис (блітинг):         {readout_time / 100 * 1000:8.2f} мс/рух миші")
+    print(f"підпис (draw):            {draw_time * 1000:8.2f} мс/рух миші")
+
+
+def hilbert_points_loop(iterations):
+    """Попередній варіант: покроковий d2xy для кожного номера, результат - список [x, y]."""
+    def rot(n, x, y, rx, ry):
+        if ry == 0:
+            if rx == 1:
+                x = n - 1 - x
+                y = n - 1 - y
+            x, y = y, x
+        return x, y
+
+    def d2xy(n, d):
+        x = y = 0
+        s = 1
+        while s < n:
+            rx = 1 & (d // 2)
+            ry = 1 & (d ^ rx)
+            x, y = rot(s, x, y, rx, ry)
+            x += s * rx
+            y += s * ry
+            d //= 4
+            s *= 2
+        return x, y
+
+    n = 2 ** iterations
+    points = []
+    for i in range(n * n):
+        x, y = d2xy(n, i)
+        points.append([x / (n - 1), y / (n - 1)])
+    return points
+
+
+def bench_hilbert():
+    """Векторизований d2xy кривої Гільберта проти покрокового циклу."""
+    print(f"{'порядок':>8} {'точок':>10} {'цикл, с':>9} {'numpy, с':>9} {'прискорення':>12} {'збіг':>5}")
+    for order in (4, 6, 8, 10):
+        loop_time, expected = measure(lambda: hilbert_points_loop(order), repeat=1)
+        numpy_time, points = measure(lambda: hilbert_points(order))
+        # Порівняння бітових представлень, а не значень з допуском
+        same = np.array_equal(np.array(expected).view(np.uint64), points.view(np.uint64))
+        print(f"{order:>8} {len(points):>10} {loop_time:>9.3f} {numpy_time:>9.4f} "
+              f"{loop_time / numpy_time:>11.0f}x {'так' if same else 'ні':>5}")
+    # Старші порядки - лише векторизований варіант; 14-й у float32, щоб вміститися в пам'ять
+    for order, dtype in ((12, np.float64), (13, np.float64), (14, np.float32)):
+        numpy_time, points = measure(lambda: hilbert_points(order, dtype=dtype), repeat=1)
+        print(f"{order:>8} {len(points):>10} {'-':>9} {numpy_time:>9.2f}  ({np.dtype(dtype).name})")
+        del points
+
+
+def bench_hilbert_stream():
+    """Потоковий експорт кривої Гільберта: час і пікова пам'ять не залежать від повного розміру кривої."""
+    print(f"{'порядок':>8} {'точок':>10} {'формат':>7} {'час, с':>8} {'пік пам., МБ':>13} {'файл, МБ':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for order in (8, 10, 12, 13):
+            for name, export in (('bin', export_binary), ('svg', export_svg)):
+                path = os.path.join(directory, f"hilbert.{name}")
+                tracemalloc.start()
+                start = time.perf_counter()
+                export(path, order)
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{order:>8} {4 ** order:>10} {name:>7} {elapsed:>8.2f} {peak / 2 ** 20:>13.1f} "
+                      f"{os.path.getsize(path) / 2 ** 20:>9.1f}")
+
+
+def lru_misses(visits, capacity):
+    """Кількість промахів кешу LRU на capacity плиток для послідовності наборів плиток."""
+    cache = OrderedDict()
+    misses = 0
+    for tiles in visits:
+        for tile in tiles:
+            if tile in cache:
+                cache.move_to_end(tile)
+                continue
+            misses += 1
+            cache[tile] = None
+            if len(cache) > capacity:
+                cache.popitem(last=False)
+    return misses
+
+
+def bench_hilbert_tiles():
+    """Обхід плиток зображення в порядку кривої Гільберта проти порядку рядків (локальність кешу)."""
+    size, tile = 8192, 32
+    columns = size // tile
+    image = np.random.default_rng(0).random((size, size), dtype=np.float32)
+    orders = {
+        'рядки': np.arange(columns * columns),
+        'Гільберт': hilbert_grid_order(columns, columns),
+    }
+
+    def neighbourhood(index):
+        # Плитка разом із сусідніми: як фільтр, що читає окіл розміром у плитку
+        row, column = divmod(int(index), columns)
+        return [(r, c) for r in range(max(row - 1, 0), min(row + 2, columns))
+                for c in range(max(column - 1, 0), min(column + 2, columns))]
+
+    def sweep(order):
+        total = 0.0
+        for index in order:
+            row, column = divmod(int(index), columns)
+            y0, x0 = max(row - 1, 0) * tile, max(column - 1, 0) * tile
+            total += image[y0:(row + 2) * tile, x0:(column + 2) * tile].sum()
+        return total
+
+    print(f"зображення {size}x{size} float32, плитки {tile}x{tile}, окіл 3x3 плитки")
+    print(f"{'порядок':>10} {'час, с':>8} " + " ".join(f"{f'LRU {n}':>9}" for n in (16, 64, 256)))
+    for name, order in orders.items():
+        elapsed, _ = measure(lambda: sweep(order))
+        visits = [neighbourhood(index) for index in order]
+        misses = [lru_misses(visits, capacity) for capacity in (16, 64, 256)]
+        print(f"{name:>10} {elapsed:>8.3f} " + " ".join(f"{m:>9}" for m in misses))
+
+
+def bench_hilbert_lod():
+    """Кадр масштабування кривої Гільберта: уся крива в plot проти видимої частини з деталізацією за пікселем."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(8, 7), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.add_subplot(111)
+    # Вісім кроків наближення вдвічі до точки всередині квадрата
+    views = [(0.37 - 0.55 * 0.5 ** k, 0.37 + 0.55 * 0.5 ** k, 0.61 - 0.55 * 0.5 ** k, 0.61 + 0.55 * 0.5 ** k)
+             for k in range(8)]
+
+    def frames(line, order, lod):
+        for x_min, x_max, y_min, y_max in views:
+            axes.set_xlim(x_min, x_max)
+            axes.set_ylim(y_min, y_max)
+            if lod:
+                shown = lod_order(order, x_max - x_min, axes.bbox.width)
+                points = hilbert_window(shown, x_min, x_max, y_min, y_max)
+                line.set_data(points[:, 0], points[:, 1])
+            canvas.draw()
+
+    print(f"{'порядок':>8} {'уся крива, мс/кадр':>19} {'LOD, мс/кадр':>13}")
+    for order in (6, 8, 10, 12, 14):
+        full = '-'
+        if order <= 10:
+            axes.clear()
+            points = hilbert_points(order)
+            line, = axes.plot(points[:, 0], points[:, 1])
+            elapsed, _ = measure(lambda: frames(line, order, False), repeat=1)
+            full = f"{elapsed / len(views) * 1000:.1f}"
+        axes.clear()
+        line, = axes.plot([], [])
+        elapsed, _ = measure(lambda: frames(line, order, True), repeat=1)
+        print(f"{order:>8} {full:>19} {elapsed / len(views) * 1000:>13.1f}")
+
+
+BENCHMARKS = {
+    'tiled': bench_tiled,
+    'active_set': bench_active_set,
+    'deep_zoom': bench_deep_zoom,
+    'backends': bench_backends,
+    'smooth': bench_smooth,
+    'precision': bench_precision,
+    'display': bench_display,
+    'redraw': bench_redraw,
+    'hilbert': bench_hilbert,
+    'hilbert_stream': bench_hilbert_stream,
+    'hilbert_tiles': bench_hilbert_tiles,
+    'hilbert_lod': bench_hilbert_lod,
+}
+
+
+if __name__ == "__main__":
+    # Переповнення sinh для точок, що втекли, очікуване
+    warnings.filterwarnings('ignore', category=RuntimeWarning)
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"== {name}: {BENCHMARKS[name].__doc__}")
+        BENCHMARKS[name]()
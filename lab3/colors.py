@@ -0,0 +1,30 @@
+import functools
+
+import numpy as np
+from matplotlib import colormaps
+
+
+@functools.lru_cache(maxsize=None)
+def colormap_lut(name, size=256):
+    """Таблиця кольорів колірної схеми matplotlib: масив uint8 (size x 4, RGBA)."""
+    cmap = colormaps[name]
+    if size != cmap.N:
+        cmap = cmap.resampled(size)
+    return cmap(np.arange(size), bytes=True)
+
+
+def colorize(data, colormap, vmin=None, vmax=None, size=256, out=None):
+    """Перетворює карту ітерацій у кольори uint8 (висота x ширина x 4) без створення фігури.
+
+    Як і imshow, за замовчуванням масштабує дані від найменшого до найбільшого значення.
+    size - кількість кольорів у таблиці (4096 для плавного забарвлення); out - готовий
+    буфер відповідної форми, щоб не виділяти пам'ять для кожного кадру.
+    """
+    lut = colormap_lut(colormap, size)
+    low = data.min() if vmin is None else vmin
+    high = data.max() if vmax is None else vmax
+    scale = len(lut) / (high - low) if high > low else 0.0
+    index = ((data - low) * scale).astype(np.intp)
+    np.clip(index, 0, len(lut) - 1, out=index)
+    # Індекси вже обмежені; з mode='clip' take пише одразу в out, без проміжного буфера
+    return np.take(lut, index, axis=0, out=out, mode='clip')
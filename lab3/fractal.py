@@ -0,0 +1,299 @@
+import numpy as np
+
+from kernels import escape_time_jit, resolve_backend
+
+# Одинарна точність вмикається автоматично, якщо крок пікселя не менший за цю частку
+# модуля координат: тоді похибка float32 (~6e-8) у тисячі разів менша за піксель
+SINGLE_PRECISION_MIN_SPACING = 2.0 ** -12
+# Найбільший радіус виходу, який ще має запас до межі float32 (~3.4e38)
+SINGLE_PRECISION_MAX_RADIUS = 1e30
+
+
+class RenderCancelled(Exception):
+    """Обчислення перервано, бо його результат більше не потрібен."""
+
+
+def escape_time(Z, c, max_iterations, escape_radius, on_iteration=None, fraction=None):
+    """Обчислює номер ітерації «втечі» для кожної точки сітки Z (0 - точка не втекла).
+
+    on_iteration(i, active) викликається після кожної ітерації з кількістю точок,
+    що ще не втекли; якщо вона повертає True, цикл припиняється.
+    Якщо задано масив fraction (форми Z), у нього записується дробова частина втечі
+    (див. escape_fraction) для точок, що втекли.
+    """
+    # Ініціалізація матриці результатів - кожен піксель спочатку має значення 0
+    result = np.zeros(Z.size, dtype=np.int32)
+    if fraction is not None:
+        fraction_flat = fraction.reshape(-1)
+
+    # Працюємо лише з активними точками (ті, що ще не втекли): їхні індекси та значення z.
+    # Точки, що втекли, прибираються з масивів, тому кожна ітерація дешевшає
+    active = np.arange(Z.size)
+    Z_temp = Z.ravel().copy()
+    # Сітка complex64 ітерується в одинарній точності (див. sinh_single)
+    single = Z_temp.dtype == np.complex64
+
+    # Основний цикл ітерацій (до max_iterations разів)
+    for i in range(max_iterations):
+        # Якщо величина (абсолютне значення) числа більша за 700,
+        # ми вважаємо, що точка «втікла» (тобто, стала занадто великою)
+        magnitude_before = np.abs(Z_temp)
+        mask_overflow = magnitude_before > 700
+        if i == 0:
+            # На нульовій ітерації номер 0 збігається з «не втекла», тому точка лишається активною,
+            # але далі працюємо з нескінченністю
+            Z_temp[mask_overflow] = np.inf
+
+        # Застосування функції: обчислюємо sinh(z) та додаємо комплексну константу c
+        # Наприклад, якщо Z_temp = 1 + 1i, тоді: sinh(1+1i) + c обчислюється для кожного елемента
+        Z_temp = sinh_single(Z_temp) if single else np.sinh(Z_temp)
+        Z_temp += c
+
+        # Перевірка "втечі": якщо значення стало занадто великим, записуємо номер ітерації
+        if i > 0:
+            magnitude = np.abs(Z_temp)
+            escaped = (magnitude > escape_radius) | mask_overflow
+            if np.any(escaped):
+                result[active[escaped]] = i
+                if fraction is not None:
+                    # Модулі до і після кроку вже є, тож дробова частина рахується лише для тих, що втекли
+                    part = escape_fraction(magnitude_before[escaped], magnitude[escaped], escape_radius)
+                    # Переповнення - окремий випадок, sinh такої точки вже не має сенсу
+                    part[mask_overflow[escaped]] = 0
+                    fraction_flat[active[escaped]] = part
+                # Стискаємо набір активних точок
+                still_active = ~escaped
+                active = active[still_active]
+                Z_temp = Z_temp[still_active]
+
+        if on_iteration is not None and on_iteration(i, active.size):
+            break
+        if active.size == 0:
+            break
+
+    return result.reshape(Z.shape)
+
+
+def sinh_single(Z):
+    """sh(z) для масиву complex64.
+
+    np.sinh для комплексних чисел не векторизований і в complex64 не швидший, тому
+    sh(x + iy) = sh x cos y + i ch x sin y обчислюється через дійсні функції у float32.
+    sh x береться через expm1, щоб не втрачати точність при малих x.
+    """
+    x, y = Z.real, Z.imag
+    exp_pos = np.expm1(x)
+    exp_neg = np.expm1(-x)
+    # 2 sh x = (e^x - 1) - (e^-x - 1), 2 ch x = (e^x - 1) + (e^-x - 1) + 2
+    sinh_x = exp_pos - exp_neg
+    sinh_x *= 0.5
+    cosh_x = exp_pos + exp_neg
+    cosh_x += 2
+    cosh_x *= 0.5
+    result = np.empty_like(Z)
+    # Множимо окремо дійсні масиви: комплексне множення inf на число дає nan в обох частинах.
+    # Для точок, що вже нескінченні, nan лише в одній частині, і модуль лишається нескінченним
+    with np.errstate(invalid='ignore'):
+        np.multiply(sinh_x, np.cos(y), out=result.real)
+        np.multiply(cosh_x, np.sin(y), out=result.imag)
+    return result
+
+
+def escape_fraction(magnitude_before, magnitude, escape_radius):
+    """Дробова частина ітерації втечі з [0, 1] для плавного забарвлення.
+
+    Логарифм модуля лінійно інтерполюється між останнім кроком до втечі та кроком втечі:
+    0 - точка ледь не втекла на попередній ітерації, 1 - ледь втекла на поточній. Тому
+    номер втечі плюс ця частина неперервний на межах смуг однакового номера.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_before = np.log(magnitude_before)
+        result = (np.log(escape_radius) - log_before) / (np.log(magnitude) - log_before)
+    # Нескінченності (точки, що стали нескінченними на нульовій ітерації) дають 0
+    result[~np.isfinite(result)] = 0
+    return np.clip(result, 0, 1, out=result)
+
+
+def iteration_cutoff(result, stop_fraction=0.01):
+    """Повертає ітерацію, на якій звичайний цикл зупинився б через правило «менше 1% точок».
+
+    result - номери ітерацій втечі, обчислені без раннього виходу (або з
+    раннім виходом не раніше за шукану ітерацію). Якщо правило не спрацьовує - None.
+    """
+    total = result.size
+    # Кількість точок, які ще не втекли після ітерації i: ті, що мають 0 або номер більший за i
+    escaped = np.cumsum(np.bincount(result.ravel(), minlength=1)[1:])
+    active = total - escaped
+    hits = np.flatnonzero(active < total * stop_fraction)
+    if hits.size == 0:
+        return None
+    return int(hits[0]) + 1
+
+
+def apply_iteration_cutoff(result, stop_fraction=0.01):
+    """Обнуляє точки, що втекли після ітерації, на якій спрацював би ранній вихід (in-place)."""
+    cutoff = iteration_cutoff(result, stop_fraction)
+    if cutoff is not None:
+        result[result > cutoff] = 0
+    return result
+
+
+class HyperbolicSinusFractal:
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self.max_iterations = 100
+        self.escape_radius = 1000
+        self.x_min, self.x_max = -2.5, 2.5
+        self.y_min, self.y_max = -2.0, 2.0
+        self.colormap = 'viridis'
+        # Ядро циклу втечі: 'numpy', 'numba' або 'auto' (numba, якщо встановлено)
+        self.backend = 'auto'
+        # Плавне забарвлення: до номера втечі додається дробова частина (див. escape_fraction)
+        self.smooth = False
+        # Тип результату; float32 удвічі економить пам'ять для великих зображень
+        self.dtype = np.float64
+        # Точність обчислень: 'double', 'single' (complex64) або 'auto' (за кроком пікселя)
+        self.precision = 'auto'
+
+    def single_precision(self):
+        """Чи обчислювати в complex64: для 'auto' - якщо похибка float32 набагато менша за піксель.
+
+        Скомпільоване ядро numba рахує лише у float64, тому з ним сітка завжди подвійної
+        точності: інакше координати, округлені до float32, ітерувались би у float64, і результат
+        не збігався б з жодним із режимів.
+        """
+        if resolve_backend(self.backend) == 'numba':
+            return False
+        if self.precision != 'auto':
+            return self.precision == 'single'
+        spacing = min((self.x_max - self.x_min) / max(self.width - 1, 1),
+                      (self.y_max - self.y_min) / max(self.height - 1, 1))
+        # Навіть біля нуля орбіти швидко виходять на значення порядку одиниці
+        magnitude = max(abs(self.x_min), abs(self.x_max), abs(self.y_min), abs(self.y_max), 1.0)
+        return (spacing >= magnitude * SINGLE_PRECISION_MIN_SPACING
+                and self.escape_radius <= SINGLE_PRECISION_MAX_RADIUS)
+
+    def real_dtype(self):
+        """Тип координат сітки: float32 в одинарній точності, інакше float64."""
+        return np.float32 if self.single_precision() else np.float64
+
+    def output_dtype(self):
+        """Тип нормалізованої карти (та дробової частини втечі)."""
+        return np.float32 if self.single_precision() else self.dtype
+
+    def grid_axes(self):
+        """Координати пікселів уздовж осей x та y."""
+        x = np.linspace(self.x_min, self.x_max, self.width, dtype=self.real_dtype())
+        y = np.linspace(self.y_min, self.y_max, self.height, dtype=self.real_dtype())
+        return x, y
+
+    def new_fraction(self, shape):
+        """Масив для дробової частини втечі або None, якщо плавне забарвлення вимкнене."""
+        return np.zeros(shape, dtype=self.output_dtype()) if self.smooth else None
+
+    def normalize(self, result, fraction=None):
+        """Ділить карту ітерацій на max_iterations, повертаючи масив типу output_dtype().
+
+        Якщо задано fraction, до номера втечі додається дробова частина (плавне забарвлення);
+        fraction при цьому змінюється на місці.
+        """
+        normalized = result.astype(self.output_dtype())
+        if fraction is not None:
+            # Точки, що не втекли або відкинуті правилом «менше 1%», лишаються нулями
+            fraction[result == 0] = 0
+            normalized += fraction
+        normalized /= self.max_iterations
+        return normalized
+
+    def generate(self, c_real, c_imag, on_progress=None):
+        """Повертає нормалізовану карту ітерацій.
+
+        on_progress(done, total) викликається після кожної ітерації; якщо вона повертає True,
+        обчислення переривається винятком RenderCancelled.
+        """
+        # Створення масивів для осей x та y
+        x, y = self.grid_axes()
+        # Об'єднуємо дійсні та уявні частини в одне комплексне число c
+        c = complex(c_real, c_imag)
+
+        # Створення комплексної сітки точок
+        # np.meshgrid створює дві матриці: X з значеннями x та Y з значеннями y
+        X, Y = np.meshgrid(x, y)
+        # Кожну точку перетворюємо у комплексне число: z = x + iy
+        Z = X + 1j * Y
+
+        if resolve_backend(self.backend) == 'numba':
+            def on_chunk(done, total):
+                if on_progress is not None and on_progress(done, total):
+                    raise RenderCancelled()
+                return False
+
+            # Скомпільоване ядро рахує кожну точку до її втечі, а правило «менше 1%»
+            # застосовується до готової карти - результат той самий
+            fraction = self.new_fraction(Z.shape)
+            result = escape_time_jit(Z, c, self.max_iterations, self.escape_radius, on_chunk=on_chunk,
+                                     fraction=fraction)
+            apply_iteration_cutoff(result)
+            return self.normalize(result, fraction)
+
+        # Якщо майже всі точки (менше 1% залишилось оброблятись) вже "втікли", припиняємо цикл
+        min_active = self.width * self.height * 0.01
+
+        def on_iteration(i, active):
+            if on_progress is not None and on_progress(i + 1, self.max_iterations):
+                raise RenderCancelled()
+            return active < min_active
+
+        fraction = self.new_fraction(Z.shape)
+        result = escape_time(Z, c, self.max_iterations, self.escape_radius, on_iteration=on_iteration,
+                             fraction=fraction)
+
+        # Нормалізація: ділимо кожне число з result на максимальну кількість ітерацій,
+        # щоб всі значення знаходилися в діапазоні від 0 до 1
+        normalized = self.normalize(result, fraction)
+        return normalized
+
+    def generate_progressive(self, c_real, c_imag, strides=(8, 4, 2, 1), on_progress=None):
+        """Поступово обчислює фрактал, віддаючи (крок, карта ітерацій) від грубої до повної роздільності.
+
+        Прохід з кроком s обчислює кожен s-й піксель повної сітки, тому точки з грубіших
+        проходів не перераховуються. Останній прохід (s=1) збігається з generate.
+        """
+        x, y = self.grid_axes()
+        c = complex(c_real, c_imag)
+        rows, cols = np.ogrid[:self.height, :self.width]
+
+        result = np.zeros((self.height, self.width), dtype=np.int32)
+        computed = np.zeros((self.height, self.width), dtype=bool)
+        fraction = self.new_fraction((self.height, self.width))
+        use_jit = resolve_backend(self.backend) == 'numba'
+
+        for index, stride in enumerate(strides):
+            # Лише ті точки сітки з кроком stride, яких ще немає з попередніх проходів
+            mask = (rows % stride == 0) & (cols % stride == 0) & ~computed
+            ys, xs = np.nonzero(mask)
+
+            def on_step(done, total):
+                # Кожен прохід - однакова частка загального прогресу
+                if on_progress is not None and on_progress(index * total + done, len(strides) * total):
+                    raise RenderCancelled()
+                return False
+
+            # Без раннього виходу: правило «менше 1%» застосовується до вже зібраної карти
+            points = x[xs] + 1j * y[ys]
+            part = self.new_fraction(points.shape)
+            if use_jit:
+                result[ys, xs] = escape_time_jit(points, c, self.max_iterations, self.escape_radius,
+                                                 on_chunk=on_step, fraction=part)
+            else:
+                result[ys, xs] = escape_time(points, c, self.max_iterations, self.escape_radius,
+                                             on_iteration=lambda i, active: on_step(i + 1, self.max_iterations),
+                                             fraction=part)
+            if part is not None:
+                fraction[ys, xs] = part
+            computed |= mask
+
+            preview = apply_iteration_cutoff(result[::stride, ::stride].copy())
+            preview_fraction = None if fraction is None else fraction[::stride, ::stride].copy()
+            yield stride, self.normalize(preview, preview_fraction)
@@ -9,7 +9,7 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
                            QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDoubleSpinBox,
                                QFormLayout, QGroupBox, QHBoxLayout, QLabel,
-                               QMainWindow, QPushButton, QSizePolicy, QSpinBox,
+                               QMainWindow, QProgressBar, QPushButton, QSizePolicy, QSpinBox,
                                QTabWidget, QVBoxLayout, QWidget)
 
 
@@ -102,6 +102,66 @@ class Ui_MainWindow(object):
         self.adaptive_resolution.setChecked(True)
         self.sinh_param_layout.addRow(u"", self.adaptive_resolution)
 
+        # Parallel tiled rendering option
+        self.parallel_render = QCheckBox(self.sinh_param_group)
+        self.parallel_render.setObjectName(u"parallel_render")
+        self.parallel_render.setChecked(True)
+        self.sinh_param_layout.addRow(u"", self.parallel_render)
+
+        # Fast display path (colormap lookup table into a QImage, no matplotlib)
+        self.fast_view = QCheckBox(self.sinh_param_group)
+        self.fast_view.setObjectName(u"fast_view")
+        self.fast_view.setChecked(False)
+        self.sinh_param_layout.addRow(u"", self.fast_view)
+
+        # Smooth (fractional) iteration count option
+        self.smooth_coloring = QCheckBox(self.sinh_param_group)
+        self.smooth_coloring.setObjectName(u"smooth_coloring")
+        self.smooth_coloring.setChecked(False)
+        self.sinh_param_layout.addRow(u"", self.smooth_coloring)
+
+        # Single precision result option
+        self.float32_output = QCheckBox(self.sinh_param_group)
+        self.float32_output.setObjectName(u"float32_output")
+        self.float32_output.setChecked(False)
+        self.sinh_param_layout.addRow(u"", self.float32_output)
+
+        # Arithmetic precision (auto selects complex64 for shallow views)
+        self.precision_combo = QComboBox(self.sinh_param_group)
+        self.precision_combo.setObjectName(u"precision_combo")
+        self.precision_combo.addItems(['auto', 'double', 'single'])
+        self.sinh_param_layout.addRow(u"Точність обчислень:", self.precision_combo)
+
+        # Escape-time kernel backend (items are filled in by the application)
+        self.backend_combo = QComboBox(self.sinh_param_group)
+        self.backend_combo.setObjectName(u"backend_combo")
+        self.sinh_param_layout.addRow(u"Ядро обчислення:", self.backend_combo)
+
+        # Progressive refinement option
+        self.progressive_render = QCheckBox(self.sinh_param_group)
+        self.progressive_render.setObjectName(u"progressive_render")
+        self.progressive_render.setChecked(True)
+        self.sinh_param_layout.addRow(u"", self.progressive_render)
+
+        # Deep zoom (perturbation) option
+        self.deep_zoom = QCheckBox(self.sinh_param_group)
+        self.deep_zoom.setObjectName(u"deep_zoom")
+        self.deep_zoom.setChecked(False)
+        self.sinh_param_layout.addRow(u"", self.deep_zoom)
+
+        # Tile cache budget (0 disables the cache). Off by default: the cached path renders
+        # in one process
+        self.tile_cache_input = QSpinBox(self.sinh_param_group)
+        self.tile_cache_input.setObjectName(u"tile_cache_input")
+        self.tile_cache_input.setRange(0, 8192)
+        self.tile_cache_input.setSingleStep(64)
+        self.tile_cache_input.setValue(0)
+        self.sinh_param_layout.addRow(u"Кеш плиток (МБ, 0 - вимкнено):", self.tile_cache_input)
+
+        self.cache_stats_label = QLabel(self.sinh_param_group)
+        self.cache_stats_label.setObjectName(u"cache_stats_label")
+        self.sinh_param_layout.addRow(u"Кеш (влучання / промахи):", self.cache_stats_label)
+
         # Colormap selection
         self.colormap_combo = QComboBox(self.sinh_param_group)
         self.colormap_combo.setObjectName(u"colormap_combo")
@@ -114,6 +174,18 @@ class Ui_MainWindow(object):
         self.coords_label.setObjectName(u"coords_label")
         self.sinh_param_layout.addRow(u"Координати курсору:", self.coords_label)
 
+        # Render progress
+        self.sinh_progress = QProgressBar(self.sinh_param_group)
+        self.sinh_progress.setObjectName(u"sinh_progress")
+        self.sinh_progress.setRange(0, 100)
+        self.sinh_progress.setValue(0)
+        self.sinh_param_layout.addRow(u"Прогрес обчислення:", self.sinh_progress)
+
+        # Frame time breakdown
+        self.frame_time_label = QLabel(self.sinh_param_group)
+        self.frame_time_label.setObjectName(u"frame_time_label")
+        self.sinh_param_layout.addRow(u"Час кадру (обчислення / кольори / виведення):", self.frame_time_label)
+
         self.sinh_control_layout.addWidget(self.sinh_param_group)
 
         # View control group
@@ -173,7 +245,7 @@ class Ui_MainWindow(object):
         # Iterations input
         self.hilbert_iterations_input = QSpinBox(self.hilbert_param_group)
         self.hilbert_iterations_input.setObjectName(u"hilbert_iterations_input")
-        self.hilbert_iterations_input.setRange(1, 8)
+        self.hilbert_iterations_input.setRange(1, 14)
         self.hilbert_iterations_input.setValue(5)
         self.hilbert_param_layout.addRow(u"Кількість ітерацій:", self.hilbert_iterations_input)
 
@@ -193,6 +265,24 @@ class Ui_MainWindow(object):
 
         self.hilbert_control_layout.addWidget(self.hilbert_param_group)
 
+        # Export group: the curve is streamed to a file, so the order may exceed the on-screen limit
+        self.hilbert_export_group = QGroupBox(self.hilbert_control_panel)
+        self.hilbert_export_group.setObjectName(u"hilbert_export_group")
+        self.hilbert_export_layout = QFormLayout(self.hilbert_export_group)
+        self.hilbert_export_layout.setObjectName(u"hilbert_export_layout")
+
+        self.hilbert_export_order = QSpinBox(self.hilbert_export_group)
+        self.hilbert_export_order.setObjectName(u"hilbert_export_order")
+        self.hilbert_export_order.setRange(1, 14)
+        self.hilbert_export_order.setValue(10)
+        self.hilbert_export_layout.addRow(u"Порядок кривої:", self.hilbert_export_order)
+
+        self.hilbert_export_btn = QPushButton(self.hilbert_export_group)
+        self.hilbert_export_btn.setObjectName(u"hilbert_export_btn")
+        self.hilbert_export_layout.addRow(self.hilbert_export_btn)
+
+        self.hilbert_control_layout.addWidget(self.hilbert_export_group)
+
         # Generate and save buttons
         self.hilbert_generate_btn = QPushButton(self.hilbert_control_panel)
         self.hilbert_generate_btn.setObjectName(u"hilbert_generate_btn")
@@ -225,6 +315,20 @@ class Ui_MainWindow(object):
         self.sinh_param_group.setTitle(QCoreApplication.translate("MainWindow", u"Параметри фракталу", None))
         self.adaptive_resolution.setText(
             QCoreApplication.translate("MainWindow", u"Адаптивна роздільна здатність при збільшенні", None))
+        self.parallel_render.setText(
+            QCoreApplication.translate("MainWindow", u"Паралельне обчислення плитками", None))
+        self.progressive_render.setText(
+            QCoreApplication.translate("MainWindow", u"Поступове уточнення (від 1/8 роздільності)", None))
+        self.fast_view.setText(
+            QCoreApplication.translate("MainWindow", u"Швидкий перегляд (без matplotlib)", None))
+        self.smooth_coloring.setText(
+            QCoreApplication.translate("MainWindow", u"Плавне забарвлення (дробова кількість ітерацій)", None))
+        self.float32_output.setText(
+            QCoreApplication.translate("MainWindow", u"Результат у float32 (удвічі менше пам'яті)", None))
+        self.deep_zoom.setText(
+            QCoreApplication.translate("MainWindow", u"Глибоке масштабування (метод збурень)", None))
+        self.cache_stats_label.setText(QCoreApplication.translate("MainWindow", u"---", None))
+        self.frame_time_label.setText(QCoreApplication.translate("MainWindow", u"---", None))
         self.coords_label.setText(QCoreApplication.translate("MainWindow", u"X: --- Y: ---", None))
         self.sinh_view_group.setTitle(QCoreApplication.translate("MainWindow", u"Керування переглядом", None))
         self.sinh_clear_btn.setText(QCoreApplication.translate("MainWindow", u"Очистити сцену", None))
@@ -236,6 +340,8 @@ class Ui_MainWindow(object):
         self.color_btn.setText(QCoreApplication.translate("MainWindow", u"Вибрати колір", None))
         self.hilbert_generate_btn.setText(QCoreApplication.translate("MainWindow", u"Згенерувати криву", None))
         self.hilbert_save_btn.setText(QCoreApplication.translate("MainWindow", u"Зберегти зображення", None))
+        self.hilbert_export_group.setTitle(QCoreApplication.translate("MainWindow", u"Експорт кривої", None))
+        self.hilbert_export_btn.setText(QCoreApplication.translate("MainWindow", u"Експортувати (SVG / двійковий)", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_hilbert),
                                   QCoreApplication.translate("MainWindow", u"Крива Гільберта-Пеано", None))
     # retranslateUi
\ No newline at end of file
@@ -0,0 +1,262 @@
+import os
+
+import numpy as np
+
+# Найбільший порядок кривої: 4^14 точок ще вміщуються в індекси uint32
+MAX_ORDER = 14
+# Кількість індексів, що перетворюються за один прохід (обмежує тимчасову пам'ять)
+D2XY_CHUNK = 1 << 16
+# Розмір блоку точок при потоковому обході та експорті кривої
+STREAM_CHUNK = 1 << 20
+
+
+def _check_order(order):
+    if not 1 <= order <= MAX_ORDER:
+        raise ValueError(f"Порядок кривої Гільберта має бути від 1 до {MAX_ORDER}, отримано {order}")
+
+
+def hilbert_d2xy(order, d):
+    """Цілі координати (x, y) точок з номерами d уздовж кривої Гільберта порядку order.
+
+    Той самий алгоритм, що й покроковий d2xy, але кожен рівень (біт-пара номера)
+    обробляється одразу для всіх індексів масиву. Повертає два масиви uint32 форми d.
+    """
+    _check_order(order)
+    t = np.array(d, dtype=np.uint32)
+    x = np.zeros(t.shape, dtype=np.uint32)
+    y = np.zeros(t.shape, dtype=np.uint32)
+    rx = np.empty_like(t)
+    ry = np.empty_like(t)
+    mask = np.empty_like(t)
+    for level in range(order):
+        s = 1 << level
+        np.right_shift(t, 1, out=rx)
+        rx &= 1
+        np.bitwise_xor(t, rx, out=ry)
+        ry &= 1
+        # Поворот чверті при ry == 0: відображення в межах квадрата s (при rx == 1)
+        # і обмін x та y. Для 0 <= x < s маємо s - 1 - x == x ^ (s - 1), тому все
+        # робиться бітовими операціями на місці, без умовних масивів
+        np.bitwise_xor(ry, 1, out=mask)
+        mask &= rx
+        mask *= s - 1
+        x ^= mask
+        y ^= mask
+        np.bitwise_xor(x, y, out=mask)
+        mask *= ry ^ 1
+        x ^= mask
+        y ^= mask
+        # Додавання s*rx та s*ry: біт level у x, y ще нульовий
+        x |= rx << level
+        y |= ry << level
+        t >>= 2
+    return x, y
+
+
+def hilbert_xy2d(order, x, y):
+    """Номери d уздовж кривої Гільберта порядку order для цілих координат x, y (обернене до hilbert_d2xy).
+
+    Рівні обробляються від старшого біта до молодшого одразу для всіх точок. Повертає масив uint32.
+    """
+    _check_order(order)
+    x = np.array(x, dtype=np.uint32)
+    y = np.array(y, dtype=np.uint32)
+    x, y = np.broadcast_arrays(x, y)
+    x, y = x.copy(), y.copy()
+    d = np.zeros(x.shape, dtype=np.uint32)
+    rx = np.empty_like(d)
+    ry = np.empty_like(d)
+    mask = np.empty_like(d)
+    n = 1 << order
+    for level in reversed(range(order)):
+        np.right_shift(x, level, out=rx)
+        rx &= 1
+        np.right_shift(y, level, out=ry)
+        ry &= 1
+        # Чверть квадрата на цьому рівні: (3 * rx) ^ ry дає 0, 1, 2, 3 у порядку обходу
+        d += ((3 * rx) ^ ry) << (2 * level)
+        # Той самий поворот, що й у d2xy, але в межах усього квадрата n (n - 1 - x == x ^ (n - 1))
+        np.bitwise_xor(ry, 1, out=mask)
+        mask &= rx
+        mask *= n - 1
+        x ^= mask
+        y ^= mask
+        np.bitwise_xor(x, y, out=mask)
+        mask *= ry ^ 1
+        x ^= mask
+        y ^= mask
+    return d
+
+
+def hilbert_sort(points, order=MAX_ORDER):
+    """Перестановка, що впорядковує точки (N x 2) уздовж кривої Гільберта.
+
+    Точки масштабуються до сітки 2^order x 2^order у межах свого обмежувального
+    прямокутника; точки в одній клітинці зберігають вихідний порядок.
+    Використання: points[hilbert_sort(points)].
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) == 0:
+        return np.zeros(0, dtype=np.intp)
+    low = points.min(axis=0)
+    extent = points.max(axis=0) - low
+    cells = (1 << order) - 1
+    scale = np.divide(cells, extent, out=np.zeros(2), where=extent > 0)
+    grid = np.clip(np.rint((points - low) * scale), 0, cells).astype(np.uint32)
+    return np.argsort(hilbert_xy2d(order, grid[:, 0], grid[:, 1]), kind='stable')
+
+
+def hilbert_grid_order(columns, rows):
+    """Номери клітинок сітки columns x rows (рядок за рядком) у порядку обходу кривої Гільберта.
+
+    Розміри сітки не обов'язково степені двійки: крива будується для охопного квадрата,
+    а клітинки поза сіткою пропускаються. Сусідні в результаті клітинки здебільшого
+    сусідні й на площині, що покращує використання кешу при обробці плитками.
+    """
+    order = max(1, (max(columns, rows) - 1).bit_length())
+    row, column = np.divmod(np.arange(columns * rows), columns)
+    return np.argsort(hilbert_xy2d(order, column, row), kind='stable')
+
+
+def lod_order(order, span, pixels, min_cell_pixels=3):
+    """Порядок кривої, достатній для показу області шириною span (у частках одиничного квадрата) на pixels пікселях.
+
+    Крок сітки порядку k дорівнює 1 / (2^k - 1); дрібніші за min_cell_pixels клітинки
+    на екрані не розрізняються, тому порядок обмежується зверху, але не перевищує order.
+    """
+    if span <= 0 or pixels <= 0:
+        return order
+    cells = pixels / (span * min_cell_pixels)
+    return max(1, min(order, int(np.log2(cells + 1))))
+
+
+def hilbert_window(order, x_min, x_max, y_min, y_max):
+    """Частина кривої порядку order у прямокутнику області (координати нормалізовані до [0, 1]).
+
+    Береться кожна клітинка сітки, що потрапляє у прямокутник (з запасом в одну клітинку,
+    щоб відрізки на межі не обривались), номери сортуються, і послідовні номери утворюють
+    неперервні ділянки. Повертає масив (N x 2), де ділянки розділені рядками NaN -
+    matplotlib малює такий масив однією лінією з розривами.
+    """
+    _check_order(order)
+    n = 1 << order
+    scale = n - 1
+    x0, x1 = max(int(np.floor(x_min * scale)) - 1, 0), min(int(np.ceil(x_max * scale)) + 1, n - 1)
+    y0, y1 = max(int(np.floor(y_min * scale)) - 1, 0), min(int(np.ceil(y_max * scale)) + 1, n - 1)
+    if x0 > x1 or y0 > y1:
+        return np.empty((0, 2))
+    x = np.arange(x0, x1 + 1, dtype=np.uint32)
+    y = np.arange(y0, y1 + 1, dtype=np.uint32)[:, None]
+    d = hilbert_xy2d(order, x, y).ravel()
+    along = np.argsort(d)
+    d = d[along]
+    points = np.empty((len(d), 2))
+    points[:, 0] = np.broadcast_to(x, (len(y), len(x))).ravel()[along]
+    points[:, 1] = np.broadcast_to(y, (len(y), len(x))).ravel()[along]
+    points /= scale
+    # Розрив там, де між сусідніми номерами є точки поза прямокутником
+    breaks = np.flatnonzero(np.diff(d) != 1) + 1
+    return np.insert(points, breaks, np.nan, axis=0)
+
+
+def hilbert_points(order, start=0, stop=None, dtype=np.float64):
+    """Нормалізовані до [0, 1] точки кривої Гільберта з номерами start..stop-1: масив (N x 2).
+
+    Значення збігаються з x / (n - 1), y / (n - 1) покрокового алгоритму. Індекси
+    перетворюються частинами по D2XY_CHUNK, тож окрім результату пам'ять майже не потрібна.
+    """
+    _check_order(order)
+    n = 1 << order
+    if stop is None:
+        stop = n * n
+    points = np.empty((stop - start, 2), dtype=dtype)
+    for begin in range(start, stop, D2XY_CHUNK):
+        end = min(begin + D2XY_CHUNK, stop)
+        x, y = hilbert_d2xy(order, np.arange(begin, end, dtype=np.uint32))
+        block = points[begin - start:end - start]
+        # Ділення у float64, як у Python, і лише потім перетворення до dtype
+        block[:, 0] = x / (n - 1)
+        block[:, 1] = y / (n - 1)
+    return points
+
+
+def iter_hilbert_chunks(order, chunk=STREAM_CHUNK, start=0, stop=None, dtype=np.float64):
+    """Обходить точки кривої з номерами start..stop-1 послідовними блоками.
+
+    Повертає пари (номер першої точки, масив (не більше chunk) x 2). Кожен блок
+    обчислюється лише при запиті, тож пам'ять не залежить від порядку кривої.
+    """
+    _check_order(order)
+    if stop is None:
+        stop = 1 << (2 * order)
+    for begin in range(start, stop, chunk):
+        yield begin, hilbert_points(order, begin, min(begin + chunk, stop), dtype)
+
+
+def _write_atomic(path, write, mode='wb'):
+    # Файл з'являється під своїм ім'ям лише після повного запису
+    temp_path = f"{path}.tmp"
+    with open(temp_path, mode) as file:
+        write(file)
+    os.replace(temp_path, path)
+
+
+def export_binary(path, order, dtype=np.float32, chunk=STREAM_CHUNK):
+    """Записує точки кривої у двійковий файл: пари (x, y) підряд, little-endian dtype.
+
+    Файл читається назад через np.fromfile(path, dtype).reshape(-1, 2).
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+
+    def write(file):
+        for _, block in iter_hilbert_chunks(order, chunk, dtype=dtype):
+            block.tofile(file)
+
+    _write_atomic(path, write)
+
+
+# Сусідні точки кривої відрізняються на одну клітинку, тож кожен крок - відносна команда
+# SVG з фіксованої таблиці (вісь y в SVG спрямована вниз); індекс - 2 * (крок по y) + (x > 0 або y < 0)
+_SVG_STEPS = np.array([b"h-1", b"h1 ", b"v-1", b"v1 "], dtype='S3')
+
+
+def export_svg(path, order, size=800, color="blue", line_width=1.0, chunk=STREAM_CHUNK):
+    """Записує криву у файл SVG одним елементом path, блок за блоком.
+
+    Після початкової точки шлях складається з відносних кроків h/v на одну клітинку
+    сітки n x n (viewBox), тому текст формується таблицею без форматування чисел;
+    товщина лінії задається в пікселях зображення size x size.
+    """
+    _check_order(order)
+    n = 1 << order
+    total = n * n
+
+    def write(file):
+        file.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+                   f'viewBox="-0.5 -0.5 {n} {n}">\n'.encode())
+        file.write(f'<path fill="none" stroke="{color}" stroke-width="{line_width}" '
+                   f'vector-effect="non-scaling-stroke" stroke-linejoin="round" '
+                   f'd="M0 {n - 1}'.encode())
+        for begin in range(0, total - 1, chunk):
+            # Блок кроків begin..end-1 потребує точок begin..end
+            end = min(begin + chunk, total - 1)
+            x, y = hilbert_d2xy(order, np.arange(begin, end + 1, dtype=np.uint32))
+            dx = np.diff(x.astype(np.int32))
+            dy = np.diff(y.astype(np.int32))
+            step = 2 * (dy != 0) + ((dx > 0) | (dy < 0))
+            file.write(_SVG_STEPS[step].tobytes())
+        file.write(b'"/>\n</svg>\n')
+
+    _write_atomic(path, write)
+
+
+class HilbertCurve:
+    def __init__(self):
+        self.iterations = 5
+        self.size = 800
+        self.line_width = 1
+        self.color = "blue"
+
+    def _get_hilbert_points(self, iterations):
+        # Масив (n^2 x 2) нормалізованих координат у порядку проходження кривої
+        return hilbert_points(iterations)
@@ -0,0 +1,142 @@
+import time
+
+import numpy as np
+from PySide6.QtCore import QRectF, Qt, Signal
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QWidget
+
+
+class ImageCanvas(QWidget):
+    """Легке полотно для карти фракталу: показує RGBA-буфер через QImage без копіювання.
+
+    Буфер кольорів перевикористовується між кадрами. Колесо миші масштабує область
+    відносно курсора, перетягування лівою кнопкою зсуває її; після кожної зміни
+    надсилається view_changed з новими межами.
+    """
+
+    # (x_min, x_max, y_min, y_max) видимої області
+    view_changed = Signal(float, float, float, float)
+    # Координати курсору в одиницях області
+    cursor_moved = Signal(float, float)
+
+    ZOOM_STEP = 1.25
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(True)
+        self.setMinimumSize(200, 150)
+        # Пам'ять для кольорів найбільшого кадру та QImage для кожного розміру, що на неї посилаються
+        self._buffer = None
+        self._images = {}
+        self._image = None
+        # Межі показаного зображення та видима область (x_min, x_max, y_min, y_max)
+        self.extent = None
+        self.view = None
+        # Тривалість останнього малювання, с
+        self.paint_time = 0.0
+        self._drag = None
+
+    def pixels(self, height, width, reserve=0):
+        """Буфер uint8 (висота x ширина x 4) для наступного кадру.
+
+        Кадри різного розміру (проходи поступового уточнення) займають початок тієї самої
+        пам'яті, тому вона виділяється заново лише для кадру, більшого за всі попередні.
+        QImage для кожного розміру створюється один раз і лише посилається на цю пам'ять.
+        reserve - кількість пікселів, під яку варто виділити пам'ять одразу (повний кадр).
+        """
+        size = height * width * 4
+        if self._buffer is None or self._buffer.size < size:
+            self._buffer = np.zeros(max(size, reserve * 4), dtype=np.uint8)
+            self._images.clear()
+        image = self._images.get((height, width))
+        if image is None:
+            # QImage лише посилається на пам'ять масиву, без копіювання
+            image = QImage(self._buffer.data, width, height, width * 4, QImage.Format_RGBA8888)
+            self._images[height, width] = image
+        self._image = image
+        # Суцільне представлення початку буфера: colorize пише в нього на місці
+        return self._buffer[:size].reshape(height, width, 4)
+
+    def show_pixels(self, extent, keep_view=False):
+        """Показує вміст буфера pixels() у межах extent і одразу перемальовує полотно."""
+        self.extent = tuple(extent)
+        if not keep_view or self.view is None:
+            self.view = self.extent
+        self.repaint()
+
+    def shift(self, dx, dy):
+        """Зсуває координати зображення та області (при перенесенні центру глибокого масштабування)."""
+        if self.extent is not None:
+            x_min, x_max, y_min, y_max = self.extent
+            self.extent = (x_min + dx, x_max + dx, y_min + dy, y_max + dy)
+        if self.view is not None:
+            x_min, x_max, y_min, y_max = self.view
+            self.view = (x_min + dx, x_max + dx, y_min + dy, y_max + dy)
+
+    def clear(self):
+        self.extent = None
+        self.view = None
+        self.update()
+
+    def _viewport(self):
+        """Прямокутник віджета, у який вписана видима область з однаковим масштабом по осях."""
+        x_min, x_max, y_min, y_max = self.view
+        scale = min(self.width() / (x_max - x_min), self.height() / (y_max - y_min))
+        width, height = (x_max - x_min) * scale, (y_max - y_min) * scale
+        return QRectF((self.width() - width) / 2, (self.height() - height) / 2, width, height), scale
+
+    def _to_view(self, position):
+        rect, scale = self._viewport()
+        x = self.view[0] + (position.x() - rect.left()) / scale
+        y = self.view[3] - (position.y() - rect.top()) / scale
+        return x, y
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        if self._image is not None and self.extent is not None:
+            rect, scale = self._viewport()
+            x_min, x_max, y_min, y_max = self.extent
+            # Рядок 0 буфера - верхній край зображення
+            target = QRectF(rect.left() + (x_min - self.view[0]) * scale,
+                            rect.top() + (self.view[3] - y_max) * scale,
+                            (x_max - x_min) * scale, (y_max - y_min) * scale)
+            painter.setClipRect(rect)
+            painter.drawImage(target, self._image)
+        painter.end()
+        self.paint_time = time.perf_counter() - start
+
+    def wheelEvent(self, event):
+        if self.view is None:
+            return
+        x, y = self._to_view(event.position())
+        factor = 1 / self.ZOOM_STEP if event.angleDelta().y() > 0 else self.ZOOM_STEP
+        x_min, x_max, y_min, y_max = self.view
+        self.view = (x + (x_min - x) * factor, x + (x_max - x) * factor,
+                     y + (y_min - y) * factor, y + (y_max - y) * factor)
+        self.update()
+        self.view_changed.emit(*self.view)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.view is not None:
+            self._drag = (event.position(), self.view)
+
+    def mouseMoveEvent(self, event):
+        if self.view is None:
+            return
+        if self._drag is not None:
+            origin, (x_min, x_max, y_min, y_max) = self._drag
+            _, scale = self._viewport()
+            dx = (event.position().x() - origin.x()) / scale
+            dy = (event.position().y() - origin.y()) / scale
+            self.view = (x_min - dx, x_max - dx, y_min + dy, y_max + dy)
+            self.update()
+        self.cursor_moved.emit(*self._to_view(event.position()))
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self._drag is not None:
+            moved = self.view != self._drag[1]
+            self._drag = None
+            if moved:
+                self.view_changed.emit(*self.view)
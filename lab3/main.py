@@ -1,10 +1,26 @@
 import sys
+import time
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
 from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QColorDialog
 
 from graph import Ui_MainWindow
+from fractal import HyperbolicSinusFractal
+from tiles import TiledRenderer
+from render_worker import RenderManager
+from tile_cache import CachedRenderer
+from perturbation import DeepZoomFractal
+from kernels import available_backends, resolve_backend
+from colors import colorize
+from image_view import ImageCanvas
+from hilbert import HilbertCurve, export_binary, export_svg, hilbert_points, hilbert_window, lod_order
+
+# Роздільність збереження зображень, точок на дюйм
+SAVE_DPI = 300
+# Найбільший порядок кривої Гільберта у векторному зображенні (4^10 відрізків); повна крива
+# більшого порядку записується потоково кнопкою експорту (export_svg)
+VECTOR_MAX_ORDER = 10
 
 
 class FractalCanvas(FigureCanvasQTAgg):
@@ -16,137 +32,34 @@ class FractalCanvas(FigureCanvasQTAgg):
         self.fig.tight_layout()
 
 
-class HyperbolicSinusFractal:
-    def __init__(self, width=800, height=600):
-        self.width = width
-        self.height = height
-        self.max_iterations = 100
-        self.escape_radius = 1000
-        self.x_min, self.x_max = -2.5, 2.5
-        self.y_min, self.y_max = -2.0, 2.0
-        self.colormap = 'viridis'
-
-    def generate(self, c_real, c_imag):
-        # Створення масивів для осей x та y
-        x = np.linspace(self.x_min, self.x_max, self.width)
-        y = np.linspace(self.y_min, self.y_max, self.height)
-        # Об'єднуємо дійсні та уявні частини в одне комплексне число c
-        c = complex(c_real, c_imag)
-
-        # Ініціалізація матриці результатів - кожен піксель спочатку має значення 0
-        result = np.zeros((self.height, self.width))
-
-        # Створення комплексної сітки точок
-        # np.meshgrid створює дві матриці: X з значеннями x та Y з значеннями y
-        X, Y = np.meshgrid(x, y)
-        # Кожну точку перетворюємо у комплексне число: z = x + iy
-        Z = X + 1j * Y
-
-        # Робимо копію початкової сітки, над якою будемо робити обчислення
-        Z_temp = np.copy(Z)
-
-        # Основний цикл ітерацій (до max_iterations разів)
-        for i in range(self.max_iterations):
-            # Якщо величина (абсолютне значення) будь-якого з чисел більша за 700,
-            # ми вважаємо, що точка «втікла» (тобто, стала занадто великою)
-            mask_overflow = np.abs(Z_temp) > 700
-            if np.any(mask_overflow):
-                # Для тих точок, які ще не були зафіксовані (result==0),
-                # записуємо номер ітерації i
-                result[mask_overflow & (result == 0)] = i
-                # Призначаємо значення нескінченності, щоб більше з цією точкою не працювати
-                Z_temp[mask_overflow] = np.inf
-
-            # Застосування функції: обчислюємо sinh(z) та додаємо комплексну константу c
-            # Наприклад, якщо Z_temp = 1 + 1i, тоді: sinh(1+1i) + c обчислюється для кожного елемента
-            try:
-                Z_temp = np.sinh(Z_temp) + c
-            except:
-                # Якщо виникають проблеми з числовими помилками, встановлюємо їх як Inf
-                Z_temp[np.isnan(Z_temp) | np.isinf(Z_temp)] = np.inf
-
-            # Перевірка "втечі": якщо значення стало занадто великим, знову записуємо номер ітерації
-            mask = (np.abs(Z_temp) > self.escape_radius) & (result == 0)
-            result[mask] = i
-
-            # Якщо майже всі точки (менше 1% залишилось оброблятись) вже "втікли", припиняємо цикл
-            if np.sum(result == 0) < (self.width * self.height * 0.01):
-                break
-
-        # Нормалізація: ділимо кожне число з result на максимальну кількість ітерацій,
-        # щоб всі значення знаходилися в діапазоні від 0 до 1
-        normalized = result / self.max_iterations
-        return normalized
-
-
-class HilbertCurve:
-    def __init__(self):
-        self.iterations = 5
-        self.size = 800
-        self.line_width = 1
-        self.color = "blue"
-
-    def _get_hilbert_points(self, iterations):
-        def rot(n, x, y, rx, ry):
-            # Якщо ry == 0, це означає, що ми повинні повернути точку для отримання правильної орієнтації
-            if ry == 0:
-                if rx == 1:
-                    # Якщо rx == 1, відображаємо (інвертуємо) координати в межах квадрату розміру n
-                    x = n - 1 - x
-                    y = n - 1 - y
-                # Міняємо місцями x та y
-                x, y = y, x
-            return x, y
-
-        def d2xy(n, d):
-            x = y = 0
-            # s представляє поточну «роздільну здатність» у квадраті
-            s = 1
-            while s < n:
-                # rx отримуємо за допомогою бітової операції: перевіряємо певний біт числа d
-                rx = 1 & (d // 2)
-                # ry визначається за допомогою виключного АБО (XOR) з rx
-                ry = 1 & (d ^ rx)
-                # Використовуємо функцію повороту, щоб скоригувати x та y
-                x, y = rot(s, x, y, rx, ry)
-                # Коригуємо координати: додаємо s*rx до x та s*ry до y
-                x += s * rx
-                y += s * ry
-                # Зменшуємо d, «видаляючи» оброблену частину (поділ на 4)
-                d //= 4
-                # Збільшуємо s у 2 рази для наступного рівня детальності
-                s *= 2
-            return x, y
-
-        # n визначає розмір сітки по одному краю. Наприклад, при iterations = 3: n = 2^3 = 8.
-        n = 2 ** iterations
-        # Загальна кількість точок у сітці: квадрат із n x n точок.
-        total_points = n * n
-
-        points = []
-        # Для кожного порядкового номера від 0 до total_points - 1
-        for i in range(total_points):
-            # Обчислюємо координати (x, y) для даної позиції уздовж кривої
-            x, y = d2xy(n, i)
-            # Нормалізуємо координати, ділячи їх на (n - 1)
-            # Так ми отримуємо значення в діапазоні [0, 1], що зручно для побудови графіку
-            points.append([x / (n - 1), y / (n - 1)])
-        return points
-
-
 class FractalVisualizerApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        # 'auto' обирає скомпільоване ядро, якщо numba встановлено
+        self.ui.backend_combo.addItems(['auto'] + available_backends())
 
         self.sinh_fractal = HyperbolicSinusFractal()
         self.hilbert_curve = HilbertCurve()
+        self.tiled_renderer = TiledRenderer()
+        self.cached_renderer = CachedRenderer()
+        self.render_manager = RenderManager(self)
 
         self.current_xlim = None
         self.current_ylim = None
 
         self.fractal_generated = False
+        self.sinh_keep_view = False
+        # Фрактал глибокого масштабування: координати осей - відхилення від його центру
+        self.deep_fractal = None
+        # Зображення фракталу та підпис координат у фігурі matplotlib (створюються з першим кадром)
+        self.sinh_image = None
+        self.sinh_cursor_text = None
+        # Знімок фігури без анімованих елементів для блітингу координат курсору
+        self.sinh_background = None
+        # Останній показаний результат (c_real, c_imag, fractal, дані) - для перемикання перегляду та збереження
+        self.last_sinh_result = None
 
         self.setup_canvases()
 
@@ -161,28 +74,56 @@ class FractalVisualizerApp(QMainWindow):
         self.sinh_canvas.mpl_connect('draw_event', self.on_sinh_draw)
         self.sinh_canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
 
+        # Швидкий перегляд: кольори через таблицю одразу у QImage, без фігури matplotlib
+        self.sinh_image_view = ImageCanvas()
+        self.sinh_image_view.hide()
+        self.ui.sinh_left_layout.addWidget(self.sinh_image_view)
+        self.sinh_image_view.view_changed.connect(self.on_fast_view_changed)
+        self.sinh_image_view.cursor_moved.connect(self.show_cursor_coords)
+
         self.hilbert_canvas = FractalCanvas(width=8, height=7, dpi=100)
         self.hilbert_nav_toolbar = NavigationToolbar2QT(self.hilbert_canvas, self)
         self.ui.hilbert_left_layout.addWidget(self.hilbert_canvas)
         self.ui.hilbert_left_layout.addWidget(self.hilbert_nav_toolbar)
+        # Лінія кривої містить лише видиму частину з деталізацією за розміром пікселя
+        self.hilbert_line = None
+        self.hilbert_canvas.mpl_connect('resize_event', lambda event: self.update_hilbert_lod())
 
         self.curve_color = "blue"
 
     def connect_signals(self):
         self.ui.sinh_generate_btn.clicked.connect(self.generate_sinh_fractal)
-        self.ui.sinh_save_btn.clicked.connect(lambda: self.save_fractal_image(self.sinh_canvas.fig))
+        self.ui.sinh_save_btn.clicked.connect(self.save_sinh_image)
         self.ui.sinh_clear_btn.clicked.connect(self.clear_sinh_scene)
+        self.ui.deep_zoom.toggled.connect(self.on_deep_zoom_toggled)
+        self.ui.fast_view.toggled.connect(self.on_fast_view_toggled)
+        self.render_manager.progress_changed.connect(self.on_sinh_progress)
+        self.render_manager.result_ready.connect(self.show_sinh_fractal)
 
         self.ui.hilbert_generate_btn.clicked.connect(self.generate_hilbert_curve)
-        self.ui.hilbert_save_btn.clicked.connect(lambda: self.save_fractal_image(self.hilbert_canvas.fig))
+        self.ui.hilbert_save_btn.clicked.connect(self.save_hilbert_image)
+        self.ui.hilbert_export_btn.clicked.connect(self.export_hilbert_curve)
         self.ui.color_btn.clicked.connect(self.select_color)
 
     def on_mouse_move(self, event):
         if event.inaxes:
-            x, y = event.xdata, event.ydata
+            self.show_cursor_coords(event.xdata, event.ydata)
+            if self.sinh_cursor_text is not None and self.sinh_background is not None:
+                # Блітинг: відновлюємо знімок і перемальовуємо лише підпис, без повного draw()
+                self.sinh_canvas.restore_region(self.sinh_background)
+                self.sinh_cursor_text.set_text(self.ui.coords_label.text())
+                self.sinh_canvas.axes.draw_artist(self.sinh_cursor_text)
+                self.sinh_canvas.blit(self.sinh_canvas.axes.bbox)
+
+    def show_cursor_coords(self, x, y):
+        if self.deep_fractal is not None:
+            self.ui.coords_label.setText(f"ΔX: {x:.4e} ΔY: {y:.4e}")
+        else:
             self.ui.coords_label.setText(f"X: {x:.4f} Y: {y:.4f}")
 
     def on_sinh_draw(self, event):
+        self.sinh_background = self.sinh_canvas.copy_from_bbox(self.sinh_canvas.fig.bbox)
+
         if not self.ui.adaptive_resolution.isChecked() or not self.fractal_generated:
             return
 
@@ -194,7 +135,20 @@ class FractalVisualizerApp(QMainWindow):
             x_ratio = abs(xlim[1] - xlim[0]) / abs(self.current_xlim[1] - self.current_xlim[0])
             y_ratio = abs(ylim[1] - ylim[0]) / abs(self.current_ylim[1] - self.current_ylim[0])
 
-            if x_ratio < 0.8 or y_ratio < 0.8 or x_ratio > 1.2 or y_ratio > 1.2:
+            # З кешем плиток панорамування дешеве: дораховуються лише нові плитки
+            width = abs(self.current_xlim[1] - self.current_xlim[0])
+            height = abs(self.current_ylim[1] - self.current_ylim[0])
+            panned = (self.ui.tile_cache_input.value() > 0 and
+                      (abs(xlim[0] - self.current_xlim[0]) > 0.1 * width or
+                       abs(ylim[0] - self.current_ylim[0]) > 0.1 * height))
+
+            zoomed = x_ratio < 0.8 or y_ratio < 0.8 or x_ratio > 1.2 or y_ratio > 1.2
+
+            if self.deep_fractal is not None:
+                if zoomed:
+                    self.recenter_deep_zoom(xlim, ylim)
+                    self.generate_sinh_fractal(keep_view=True)
+            elif zoomed or panned:
                 self.sinh_fractal.x_min, self.sinh_fractal.x_max = xlim
                 self.sinh_fractal.y_min, self.sinh_fractal.y_max = ylim
 
@@ -203,47 +157,197 @@ class FractalVisualizerApp(QMainWindow):
 
                 self.generate_sinh_fractal(keep_view=True)
 
-    def generate_sinh_fractal(self, keep_view=False):
-        if keep_view:
-            xlim = self.sinh_canvas.axes.get_xlim()
-            ylim = self.sinh_canvas.axes.get_ylim()
+    def recenter_deep_zoom(self, xlim, ylim):
+        """Переносить центр глибокого масштабування у середину нової області перегляду."""
+        mid_x = (xlim[0] + xlim[1]) / 2
+        mid_y = (ylim[0] + ylim[1]) / 2
+        self.deep_fractal.set_view(xlim[0], xlim[1], ylim[0], ylim[1])
+
+        # Зсуваємо вже показане зображення та межі осей у координати нового центру
+        for image in self.sinh_canvas.axes.images:
+            left, right, bottom, top = image.get_extent()
+            image.set_extent((left - mid_x, right - mid_x, bottom - mid_y, top - mid_y))
+        self.current_xlim = (xlim[0] - mid_x, xlim[1] - mid_x)
+        self.current_ylim = (ylim[0] - mid_y, ylim[1] - mid_y)
+        self.sinh_canvas.axes.set_xlim(self.current_xlim)
+        self.sinh_canvas.axes.set_ylim(self.current_ylim)
+        self.sinh_canvas.draw_idle()
+
+    def on_fast_view_changed(self, x_min, x_max, y_min, y_max):
+        """Масштабування чи зсув у швидкому перегляді: дораховуємо нову область."""
+        if not self.ui.adaptive_resolution.isChecked() or not self.fractal_generated:
+            return
+        if self.deep_fractal is not None:
+            mid_x, mid_y = (x_min + x_max) / 2, (y_min + y_max) / 2
+            self.deep_fractal.set_view(x_min, x_max, y_min, y_max)
+            self.sinh_image_view.shift(-mid_x, -mid_y)
+        else:
+            self.sinh_fractal.x_min, self.sinh_fractal.x_max = x_min, x_max
+            self.sinh_fractal.y_min, self.sinh_fractal.y_max = y_min, y_max
+        self.generate_sinh_fractal(keep_view=True)
+
+    def on_fast_view_toggled(self, checked):
+        self.sinh_canvas.setVisible(not checked)
+        self.sinh_nav_toolbar.setVisible(not checked)
+        self.sinh_image_view.setVisible(checked)
+        # Показуємо вже обчислений результат у новому перегляді
+        if self.last_sinh_result is not None:
+            c_real, c_imag, fractal, fractal_data = self.last_sinh_result
+            if checked:
+                self.show_sinh_image(fractal, fractal_data)
+            else:
+                self.draw_sinh_figure(c_real, c_imag, fractal, fractal_data)
+
+    def on_deep_zoom_toggled(self, checked):
+        deep = self.deep_fractal
+        # Повертаємось до абсолютних координат, якщо float64 ще розрізняє межі області
+        if not checked and deep is not None and deep.x_max - deep.x_min > 1e-12 * max(1.0, abs(float(deep.center_real))):
+            self.sinh_fractal.x_min = float(deep.center_real) + deep.x_min
+            self.sinh_fractal.x_max = float(deep.center_real) + deep.x_max
+            self.sinh_fractal.y_min = float(deep.center_imag) + deep.y_min
+            self.sinh_fractal.y_max = float(deep.center_imag) + deep.y_max
+        self.deep_fractal = None
+        if self.fractal_generated:
+            self.generate_sinh_fractal()
 
-        self.sinh_fractal.width = self.ui.width_input.value()
-        self.sinh_fractal.height = self.ui.height_input.value()
-        self.sinh_fractal.max_iterations = self.ui.max_iterations_input.value()
-        self.sinh_fractal.escape_radius = self.ui.escape_radius_input.value()
-        self.sinh_fractal.colormap = self.ui.colormap_combo.currentText()
+    def generate_sinh_fractal(self, keep_view=False):
+        if self.ui.deep_zoom.isChecked():
+            if self.deep_fractal is None:
+                self.deep_fractal = DeepZoomFractal.from_view(self.sinh_fractal)
+            fractal = self.deep_fractal
+        else:
+            fractal = self.sinh_fractal
+
+        fractal.width = self.ui.width_input.value()
+        fractal.height = self.ui.height_input.value()
+        fractal.max_iterations = self.ui.max_iterations_input.value()
+        fractal.escape_radius = self.ui.escape_radius_input.value()
+        fractal.colormap = self.ui.colormap_combo.currentText()
+        fractal.backend = self.ui.backend_combo.currentText()
+        fractal.smooth = self.ui.smooth_coloring.isChecked()
+        fractal.dtype = np.float32 if self.ui.float32_output.isChecked() else np.float64
+        fractal.precision = self.ui.precision_combo.currentText()
 
         c_real = self.ui.c_real_input.value()
         c_imag = self.ui.c_imag_input.value()
 
-        fractal_data = self.sinh_fractal.generate(c_real, c_imag)
+        # Увімкнений кеш плиток має пріоритет: при панорамуванні дораховуються лише нові плитки
+        # (в одному процесі).
+        # Глибоке масштабування має власну сітку відхилень і рахується без них
+        progressive = self.ui.progressive_render.isChecked() and self.deep_fractal is None
+        cache_budget = self.ui.tile_cache_input.value()
+        if self.deep_fractal is not None:
+            renderer = None
+        elif cache_budget > 0:
+            self.cached_renderer.cache.set_max_bytes(cache_budget * 2 ** 20)
+            renderer = self.cached_renderer
+        # Скомпільоване ядро саме розподіляє точки між ядрами процесора, плитки йому не потрібні
+        elif (self.ui.parallel_render.isChecked() and not progressive
+              and resolve_backend(fractal.backend) == 'numpy'):
+            renderer = self.tiled_renderer
+        else:
+            renderer = None
+
+        # Обчислення виконується у фоні; попереднє незавершене завдання скасовується
+        self.sinh_keep_view = keep_view
+        self.ui.sinh_progress.setValue(0)
+        self.render_manager.submit(fractal, c_real, c_imag, renderer, progressive=progressive)
 
-        self.sinh_canvas.axes.clear()
-        img = self.sinh_canvas.axes.imshow(fractal_data, cmap=self.sinh_fractal.colormap,
-                                           extent=[self.sinh_fractal.x_min, self.sinh_fractal.x_max,
-                                                   self.sinh_fractal.y_min, self.sinh_fractal.y_max],
-                                           origin='lower', aspect='equal')
+    def on_sinh_progress(self, job_id, percent):
+        if job_id == self.render_manager.latest_job_id:
+            self.ui.sinh_progress.setValue(percent)
 
-        self.sinh_canvas.axes.set_title(f"Фрактал sh(z) + c, де c = {c_real} + {c_imag}i")
+    def show_sinh_fractal(self, job, fractal, fractal_data):
+        # Поки результат йшов до головного потоку, міг з'явитися новіший запит
+        if job.job_id != self.render_manager.latest_job_id:
+            return
 
-        self.sinh_canvas.axes.set_xticks([])
-        self.sinh_canvas.axes.set_yticks([])
+        self.last_sinh_result = (job.c_real, job.c_imag, fractal, fractal_data)
+        if self.ui.fast_view.isChecked():
+            colorize_time, output_time = self.show_sinh_image(fractal, fractal_data, self.sinh_keep_view)
+            colorize_text = f"{colorize_time * 1000:.0f}"
+        else:
+            # У matplotlib кольори накладаються під час малювання фігури
+            output_time = self.draw_sinh_figure(job.c_real, job.c_imag, fractal, fractal_data,
+                                                self.sinh_keep_view)
+            colorize_text = "-"
+        self.ui.frame_time_label.setText(
+            f"{job.compute_time * 1000:.0f} / {colorize_text} / {output_time * 1000:.0f} мс")
+
+        # Проміжні (грубі) результати поступового режиму мають меншу роздільність
+        if fractal_data.shape == (fractal.height, fractal.width):
+            self.ui.sinh_progress.setValue(100)
+        if job.renderer is self.cached_renderer:
+            stats = self.cached_renderer.cache.stats()
+            self.ui.cache_stats_label.setText(
+                f"{stats['hits']} / {stats['misses']} ({stats['hit_rate']:.0%}), "
+                f"{stats['bytes'] / 2 ** 20:.1f} МБ")
+        self.fractal_generated = True
 
+    def show_sinh_image(self, fractal, fractal_data, keep_view=False):
+        """Швидкий перегляд: кольори у буфер QImage. Повертає час (кольори, малювання), с."""
+        start = time.perf_counter()
+        height, width = fractal_data.shape
+        # Пам'ять - одразу під повний кадр: грубі проходи поступового уточнення її не перевиділяють
+        pixels = self.sinh_image_view.pixels(height, width, reserve=fractal.height * fractal.width)
+        # Плавне забарвлення має більше відтінків, тому й таблиця кольорів більша
+        colorize(fractal_data[::-1], fractal.colormap, size=4096 if fractal.smooth else 256, out=pixels)
+        colorize_time = time.perf_counter() - start
+        self.sinh_image_view.show_pixels((fractal.x_min, fractal.x_max, fractal.y_min, fractal.y_max),
+                                         keep_view)
+        return colorize_time, self.sinh_image_view.paint_time
+
+    def draw_sinh_figure(self, c_real, c_imag, fractal, fractal_data, keep_view=False):
+        """Малює результат у фігурі matplotlib. Повертає тривалість, с.
+
+        Зображення створюється один раз; наступні кадри лише оновлюють його дані та межі,
+        без очищення осей і повторного розрахунку розкладки.
+        """
+        start = time.perf_counter()
+        axes = self.sinh_canvas.axes
+        extent = [fractal.x_min, fractal.x_max, fractal.y_min, fractal.y_max]
         if keep_view:
-            self.sinh_canvas.axes.set_xlim(xlim)
-            self.sinh_canvas.axes.set_ylim(ylim)
+            xlim = axes.get_xlim()
+            ylim = axes.get_ylim()
+
+        if self.sinh_image is None:
+            self.sinh_image = axes.imshow(fractal_data, cmap=fractal.colormap, extent=extent,
+                                          origin='lower', aspect='equal')
+            axes.set_xticks([])
+            axes.set_yticks([])
+            # Координати курсору поверх зображення; оновлюються блітингом (див. on_mouse_move)
+            self.sinh_cursor_text = axes.text(0.01, 0.01, "", transform=axes.transAxes, animated=True,
+                                              color='white', fontsize=9,
+                                              bbox=dict(facecolor='black', alpha=0.5, linewidth=0))
+            axes.set_title(f"Фрактал sh(z) + c, де c = {c_real} + {c_imag}i")
+            self.sinh_canvas.fig.tight_layout()
         else:
-            self.current_xlim = self.sinh_canvas.axes.get_xlim()
-            self.current_ylim = self.sinh_canvas.axes.get_ylim()
+            self.sinh_image.set_data(fractal_data)
+            self.sinh_image.set_extent(extent)
+            self.sinh_image.set_cmap(fractal.colormap)
+            axes.set_xlim(extent[0], extent[1])
+            axes.set_ylim(extent[2], extent[3])
+            axes.set_title(f"Фрактал sh(z) + c, де c = {c_real} + {c_imag}i")
+        # Як і новий imshow, розтягуємо колірну шкалу на весь діапазон даних
+        self.sinh_image.set_clim(fractal_data.min(), fractal_data.max())
 
-        self.sinh_canvas.fig.tight_layout()
-        self.sinh_canvas.draw()
+        if keep_view:
+            axes.set_xlim(xlim)
+            axes.set_ylim(ylim)
+        else:
+            self.current_xlim = axes.get_xlim()
+            self.current_ylim = axes.get_ylim()
 
-        self.fractal_generated = True
+        self.sinh_canvas.draw()
+        return time.perf_counter() - start
 
     def clear_sinh_scene(self):
+        self.render_manager.cancel_all()
+        self.last_sinh_result = None
+        self.sinh_image_view.clear()
         self.sinh_canvas.axes.clear()
+        self.sinh_image = None
+        self.sinh_cursor_text = None
         self.sinh_canvas.fig.tight_layout()
         self.sinh_canvas.draw()
 
@@ -254,36 +358,109 @@ class FractalVisualizerApp(QMainWindow):
         self.hilbert_curve.line_width = self.ui.line_width_input.value()
         self.hilbert_curve.color = self.curve_color
 
-        points = self.hilbert_curve._get_hilbert_points(self.hilbert_curve.iterations)
-
-        self.hilbert_canvas.axes.clear()
+        axes = self.hilbert_canvas.axes
+        axes.clear()
 
-        x_vals = [p[0] for p in points]
-        y_vals = [p[1] for p in points]
-        self.hilbert_canvas.axes.plot(x_vals, y_vals, color=self.curve_color,
-                                      linewidth=self.ui.line_width_input.value())
+        self.hilbert_line, = axes.plot([], [], color=self.curve_color,
+                                       linewidth=self.ui.line_width_input.value())
+        # Межі даних - весь одиничний квадрат, навіть коли лінія містить лише його частину
+        axes.update_datalim([(0, 0), (1, 1)])
 
-        self.hilbert_canvas.axes.set_xlim(-0.05, 1.05)
-        self.hilbert_canvas.axes.set_ylim(-0.05, 1.05)
-        self.hilbert_canvas.axes.set_title(f"Крива Гільберта-Пеано (ітерацій: {self.hilbert_curve.iterations})")
-        self.hilbert_canvas.axes.axis('equal')
-        self.hilbert_canvas.axes.grid(True, linestyle='--', alpha=0.5)
+        axes.set_xlim(-0.05, 1.05)
+        axes.set_ylim(-0.05, 1.05)
+        axes.axis('equal')
+        axes.grid(True, linestyle='--', alpha=0.5)
 
         self.hilbert_canvas.fig.tight_layout()
+        # clear() скидає обробники осей, тому вони під'єднуються для кожної нової кривої
+        axes.callbacks.connect('xlim_changed', lambda axes: self.update_hilbert_lod())
+        axes.callbacks.connect('ylim_changed', lambda axes: self.update_hilbert_lod())
+        self.update_hilbert_lod()
         self.hilbert_canvas.draw()
 
+    def update_hilbert_lod(self, pixel_scale=1.0):
+        """Перебудовує лінію кривої для поточних меж осей: лише видима частина і не дрібніше за піксель.
+
+        Кількість точок обмежена розміром осей у пікселях, тому час кадру при масштабуванні
+        та перетягуванні не залежить від порядку кривої; при наближенні деталізація
+        зростає до повної. pixel_scale - у скільки разів зображення має більше пікселів,
+        ніж екран (для збереження у файл); None - векторне зображення без прив'язки до пікселів,
+        порядок обмежений VECTOR_MAX_ORDER.
+        """
+        if self.hilbert_line is None:
+            return
+        axes = self.hilbert_canvas.axes
+        x_min, x_max = axes.get_xlim()
+        y_min, y_max = axes.get_ylim()
+        iterations = self.hilbert_curve.iterations
+        if pixel_scale is None:
+            order = min(iterations, VECTOR_MAX_ORDER)
+        else:
+            order = min(lod_order(iterations, x_max - x_min, axes.bbox.width * pixel_scale),
+                        lod_order(iterations, y_max - y_min, axes.bbox.height * pixel_scale))
+        if x_min <= 0 and y_min <= 0 and x_max >= 1 and y_max >= 1:
+            # Видно весь квадрат: точки вже в порядку обходу, без сортування вікна
+            points = hilbert_points(order)
+        else:
+            points = hilbert_window(order, x_min, x_max, y_min, y_max)
+        self.hilbert_line.set_data(points[:, 0], points[:, 1])
+        title = f"Крива Гільберта-Пеано (ітерацій: {iterations}"
+        axes.set_title(title + (f", показано: {order})" if order < iterations else ")"))
+
+    def export_hilbert_curve(self):
+        """Записує криву обраного порядку у файл потоково, не будуючи її в пам'яті повністю."""
+        file_path, selected = QFileDialog.getSaveFileName(self, "Експортувати криву", "",
+                                                          "SVG (*.svg);;Двійковий float32 (*.bin)")
+        if not file_path:
+            return
+        order = self.ui.hilbert_export_order.value()
+        if selected.startswith("SVG") or file_path.lower().endswith('.svg'):
+            export_svg(file_path, order, color=self.curve_color, line_width=self.ui.line_width_input.value())
+        else:
+            export_binary(file_path, order)
+
     def select_color(self):
         color = QColorDialog.getColor()
         if color.isValid():
             self.curve_color = color.name()
             self.ui.color_btn.setStyleSheet(f"background-color: {self.curve_color}")
 
-    def save_fractal_image(self, figure):
+    def save_sinh_image(self):
+        # Експорт завжди через matplotlib: у швидкому перегляді фігуру треба спершу намалювати
+        if self.ui.fast_view.isChecked() and self.last_sinh_result is not None:
+            self.draw_sinh_figure(*self.last_sinh_result)
+        self.save_fractal_image(self.sinh_canvas.fig)
+
+    def ask_image_path(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "Зберегти зображення", "",
                                                    "PNG (*.png);;JPEG (*.jpg *.jpeg);;PDF (*.pdf);;SVG (*.svg)")
+        return file_path
+
+    def save_fractal_image(self, figure):
+        file_path = self.ask_image_path()
 
         if file_path:
-            figure.savefig(file_path, dpi=300, bbox_inches='tight')
+            figure.savefig(file_path, dpi=SAVE_DPI, bbox_inches='tight')
+
+    def save_hilbert_image(self):
+        file_path = self.ask_image_path()
+        if not file_path:
+            return
+        figure = self.hilbert_canvas.fig
+        # Лінія на екрані має деталізацію лише для екрана: для файлу вона перебудовується
+        # для роздільності SAVE_DPI (векторні формати - до VECTOR_MAX_ORDER), а після запису - повертається
+        vector = file_path.lower().endswith(('.pdf', '.svg'))
+        self.update_hilbert_lod(None if vector else SAVE_DPI / figure.dpi)
+        try:
+            figure.savefig(file_path, dpi=SAVE_DPI, bbox_inches='tight')
+        finally:
+            self.update_hilbert_lod()
+
+    def closeEvent(self, event):
+        self.render_manager.cancel_all()
+        self.render_manager.wait()
+        self.tiled_renderer.shutdown()
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,245 @@
+import decimal
+import functools
+import math
+from decimal import Decimal
+
+import numpy as np
+
+from fractal import HyperbolicSinusFractal, RenderCancelled, escape_fraction
+
+try:
+    import mpmath
+except ImportError:
+    mpmath = None
+
+# Точки, що мають |z| > OVERFLOW_RADIUS, вважаються такими, що втекли (як і у escape_time)
+OVERFLOW_RADIUS = 700
+
+
+@functools.lru_cache(maxsize=None)
+def _decimal_pi(prec):
+    """Число пі з точністю prec знаків (рецепт з документації decimal)."""
+    with decimal.localcontext() as ctx:
+        ctx.prec = prec + 2
+        three = Decimal(3)
+        lasts, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = (t * n) / d
+            s += t
+    return s
+
+
+def _decimal_cos_sin(x):
+    """cos(x) та sin(x) рядом Тейлора після зведення аргументу до [-пі, пі]."""
+    decimal.getcontext().prec += 2
+    two_pi = 2 * _decimal_pi(decimal.getcontext().prec)
+    x = x - two_pi * (x / two_pi).to_integral_value()
+    cos_sum, sin_sum = Decimal(1), x
+    term_cos, term_sin = Decimal(1), x
+    i = 1
+    while True:
+        term_cos = -term_cos * x * x / ((2 * i - 1) * (2 * i))
+        term_sin = -term_sin * x * x / ((2 * i) * (2 * i + 1))
+        if cos_sum + term_cos == cos_sum and sin_sum + term_sin == sin_sum:
+            break
+        cos_sum += term_cos
+        sin_sum += term_sin
+        i += 1
+    decimal.getcontext().prec -= 2
+    return +cos_sum, +sin_sum
+
+
+def _decimal_sinh_cosh(re, im):
+    """sinh(z) та cosh(z) для z = re + i*im, повертає пари (дійсна, уявна частина)."""
+    exp_pos = re.exp()
+    exp_neg = 1 / exp_pos
+    sinh_re, cosh_re = (exp_pos - exp_neg) / 2, (exp_pos + exp_neg) / 2
+    cos_im, sin_im = _decimal_cos_sin(im)
+    # sinh(x + iy) = sinh x cos y + i cosh x sin y; cosh(x + iy) = cosh x cos y + i sinh x sin y
+    return (sinh_re * cos_im, cosh_re * sin_im), (cosh_re * cos_im, sinh_re * sin_im)
+
+
+def reference_orbit(center_real, center_imag, c, max_iterations, digits):
+    """Опорна орбіта z -> sh(z) + c, обчислена з підвищеною точністю.
+
+    Повертає масиви complex128: Z (значення орбіти), S = sh(Z) та C = ch(Z).
+    len(Z) == len(S) + 1; орбіта обривається, коли |Z| перевищує OVERFLOW_RADIUS.
+    """
+    Z, S, C = [], [], []
+    if mpmath is not None:
+        with mpmath.workdps(digits):
+            z = mpmath.mpc(mpmath.mpf(str(center_real)), mpmath.mpf(str(center_imag)))
+            c_hp = mpmath.mpc(c.real, c.imag)
+            for _ in range(max_iterations):
+                Z.append(complex(z))
+                if abs(z) > OVERFLOW_RADIUS:
+                    break
+                s = mpmath.sinh(z)
+                S.append(complex(s))
+                C.append(complex(mpmath.cosh(z)))
+                z = s + c_hp
+            else:
+                Z.append(complex(z))
+    else:
+        with decimal.localcontext() as ctx:
+            ctx.prec = digits
+            re, im = Decimal(center_real), Decimal(center_imag)
+            c_re, c_im = Decimal(c.real), Decimal(c.imag)
+            for _ in range(max_iterations):
+                Z.append(complex(float(re), float(im)))
+                if abs(Z[-1]) > OVERFLOW_RADIUS:
+                    break
+                (s_re, s_im), (ch_re, ch_im) = _decimal_sinh_cosh(re, im)
+                S.append(complex(float(s_re), float(s_im)))
+                C.append(complex(float(ch_re), float(ch_im)))
+                re, im = s_re + c_re, s_im + c_im
+            else:
+                Z.append(complex(float(re), float(im)))
+    return np.array(Z), np.array(S, dtype=complex), np.array(C, dtype=complex)
+
+
+def perturbation_escape_time(delta, orbit, zero_orbit, max_iterations, escape_radius, on_iteration=None,
+                             fraction=None):
+    """Те саме, що escape_time, але точки задані відхиленням delta від опорної орбіти orbit.
+
+    Відхилення ітерується у float64 за точною формулою
+    sh(Z + d) = sh Z ch d + ch Z sh d, тобто d' = S (ch d - 1) + C sh d.
+    Якщо |z| стає меншим за |d| (втрата точності, «глюк») або опорна орбіта закінчилась,
+    точка переходить на орбіту нуля zero_orbit з d = z (rebasing).
+    Масив fraction, якщо заданий, заповнюється дробовою частиною втечі, як і в escape_time.
+    """
+    # Обидві орбіти в одному масиві; S і C доповнені значенням у кінцевих точках орбіт
+    Z = np.concatenate([orbit[0], zero_orbit[0]])
+    S = np.concatenate([orbit[1], [0], zero_orbit[1], [0]])
+    C = np.concatenate([orbit[2], [0], zero_orbit[2], [0]])
+    zero_start = len(orbit[0])
+    is_end = np.zeros(len(Z), dtype=bool)
+    is_end[[zero_start - 1, len(Z) - 1]] = True
+
+    result = np.zeros(delta.size, dtype=np.int32)
+    active = np.arange(delta.size)
+    d = delta.ravel().astype(complex)
+    m = np.zeros(delta.size, dtype=np.int64)
+    forced = None
+
+    for i in range(max_iterations):
+        z = Z[m] + d
+        magnitude_before = np.abs(z)
+        mask_overflow = magnitude_before > OVERFLOW_RADIUS
+        if i == 0 and np.any(mask_overflow):
+            # escape_time робить такі точки нескінченними, і на ітерації 1 вони втікають
+            forced = mask_overflow
+            d[forced] = 0
+
+        # Виявлення «глюків»: втрата точності або кінець опорної орбіти
+        glitched = is_end[m] | (np.abs(z) < np.abs(d))
+        if np.any(glitched):
+            d[glitched] = z[glitched]
+            m[glitched] = zero_start
+
+        half = np.sinh(d * 0.5)
+        d = S[m] * (2 * half * half) + C[m] * np.sinh(d)
+        m += 1
+        z = Z[m] + d
+
+        if i > 0:
+            magnitude = np.abs(z)
+            escaped = (magnitude > escape_radius) | mask_overflow
+            if forced is not None:
+                escaped |= forced
+                mask_overflow |= forced
+                forced = None
+            if np.any(escaped):
+                result[active[escaped]] = i
+                if fraction is not None:
+                    part = escape_fraction(magnitude_before[escaped], magnitude[escaped], escape_radius)
+                    part[mask_overflow[escaped]] = 0
+                    fraction.reshape(-1)[active[escaped]] = part
+                still_active = ~escaped
+                active, d, m = active[still_active], d[still_active], m[still_active]
+
+        if on_iteration is not None and on_iteration(i, active.size):
+            break
+        if active.size == 0:
+            break
+
+    return result.reshape(delta.shape)
+
+
+class DeepZoomFractal(HyperbolicSinusFractal):
+    """Фрактал sh(z) + c для глибокого масштабування методом збурень.
+
+    Центр області зберігається як Decimal з довільною точністю, а x_min..y_max -
+    це відхилення від центру у float64, тому ширина області може бути до ~1e-300.
+    """
+
+    def __init__(self, width=800, height=600):
+        super().__init__(width, height)
+        self.center_real = Decimal(0)
+        self.center_imag = Decimal(0)
+        self.x_min, self.x_max = -2.5, 2.5
+        self.y_min, self.y_max = -2.0, 2.0
+
+    @classmethod
+    def from_view(cls, fractal):
+        """Переводить звичайну область перегляду (абсолютні межі) у відхилення від центру."""
+        deep = cls(fractal.width, fractal.height)
+        deep.max_iterations = fractal.max_iterations
+        deep.escape_radius = fractal.escape_radius
+        deep.colormap = fractal.colormap
+        deep.smooth = fractal.smooth
+        deep.dtype = fractal.dtype
+        with decimal.localcontext() as ctx:
+            # Середина двох float64 у Decimal обчислюється точно
+            ctx.prec = 800
+            deep.center_real = (Decimal(fractal.x_min) + Decimal(fractal.x_max)) / 2
+            deep.center_imag = (Decimal(fractal.y_min) + Decimal(fractal.y_max)) / 2
+        half_w = (fractal.x_max - fractal.x_min) / 2
+        half_h = (fractal.y_max - fractal.y_min) / 2
+        deep.x_min, deep.x_max = -half_w, half_w
+        deep.y_min, deep.y_max = -half_h, half_h
+        return deep
+
+    def single_precision(self):
+        # Відхилення від центру малі, тож float32 для них ніколи не достатньо
+        return False
+
+    @property
+    def digits(self):
+        """Кількість десяткових знаків, достатня для опорної орбіти при поточній ширині."""
+        span = min(self.x_max - self.x_min, self.y_max - self.y_min)
+        return max(30, int(-math.log10(span)) + 30)
+
+    def set_view(self, x_min, x_max, y_min, y_max):
+        """Переносить центр у середину нових меж (задані як відхилення від поточного центру)."""
+        with decimal.localcontext() as ctx:
+            ctx.prec = self.digits + 10
+            self.center_real += Decimal((x_min + x_max) / 2)
+            self.center_imag += Decimal((y_min + y_max) / 2)
+        half_w, half_h = (x_max - x_min) / 2, (y_max - y_min) / 2
+        self.x_min, self.x_max = -half_w, half_w
+        self.y_min, self.y_max = -half_h, half_h
+
+    def generate(self, c_real, c_imag, on_progress=None):
+        x, y = self.grid_axes()
+        c = complex(c_real, c_imag)
+        orbit = reference_orbit(self.center_real, self.center_imag, c, self.max_iterations, self.digits)
+        zero_orbit = reference_orbit(0, 0, c, self.max_iterations, 30)
+
+        X, Y = np.meshgrid(x, y)
+        delta = X + 1j * Y
+
+        min_active = self.width * self.height * 0.01
+
+        def on_iteration(i, active):
+            if on_progress is not None and on_progress(i + 1, self.max_iterations):
+                raise RenderCancelled()
+            return active < min_active
+
+        fraction = self.new_fraction(delta.shape)
+        result = perturbation_escape_time(delta, orbit, zero_orbit, self.max_iterations,
+                                          self.escape_radius, on_iteration=on_iteration, fraction=fraction)
+        return self.normalize(result, fraction)
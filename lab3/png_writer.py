@@ -0,0 +1,38 @@
+import os
+import struct
+import zlib
+
+import numpy as np
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Тип кольору PNG за кількістю каналів: RGB або RGBA
+COLOR_TYPES = {3: 2, 4: 6}
+
+
+def _chunk(tag, data):
+    return (struct.pack('>I', len(data)) + tag + data
+            + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+
+
+def write_png(path, pixels, compress_level=6):
+    """Записує масив uint8 (висота x ширина x 3 або 4) у файл PNG засобами стандартної бібліотеки.
+
+    Файл спочатку пишеться під тимчасовим ім'ям і лише потім перейменовується,
+    тому перерваний запис не залишає пошкодженого зображення.
+    """
+    height, width, channels = pixels.shape
+    if channels not in COLOR_TYPES:
+        raise ValueError(f"PNG підтримує 3 або 4 канали, отримано {channels}")
+
+    # Кожен рядок починається байтом фільтра (0 - без фільтра)
+    raw = np.zeros((height, width * channels + 1), dtype=np.uint8)
+    raw[:, 1:] = pixels.reshape(height, -1)
+    header = struct.pack('>IIBBBBB', width, height, 8, COLOR_TYPES[channels], 0, 0, 0)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(PNG_SIGNATURE)
+        file.write(_chunk(b'IHDR', header))
+        file.write(_chunk(b'IDAT', zlib.compress(raw.tobytes(), compress_level)))
+        file.write(_chunk(b'IEND', b''))
+    os.replace(temp_path, path)
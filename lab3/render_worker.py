@@ -0,0 +1,123 @@
+import copy
+import threading
+import time
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from fractal import RenderCancelled
+
+
+class RenderJob(QRunnable):
+    """Одне обчислення фракталу у фоновому потоці."""
+
+    def __init__(self, manager, job_id, fractal, c_real, c_imag, renderer=None, progressive=False):
+        super().__init__()
+        self.manager = manager
+        self.job_id = job_id
+        self.fractal = fractal
+        self.c_real = c_real
+        self.c_imag = c_imag
+        self.renderer = renderer
+        self.progressive = progressive
+        self.cancelled = threading.Event()
+        self._last_percent = -1
+        # Час від початку виконання до останнього виданого результату, с
+        self.started = None
+        self.compute_time = 0.0
+
+    def _on_progress(self, done, total):
+        percent = 100 * done // total
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.manager.progress_changed.emit(self.job_id, percent)
+        return self.cancelled.is_set()
+
+    def run(self):
+        try:
+            # Завдання могло бути замінене новим, поки чекало у черзі
+            if self.cancelled.is_set():
+                return
+            self.started = time.perf_counter()
+            if self.renderer is not None:
+                if self.progressive:
+                    # Груба чернетка, поки рендерер обчислює повне зображення
+                    for _, data in self.fractal.generate_progressive(
+                            self.c_real, self.c_imag, strides=(8,),
+                            on_progress=lambda done, total: self.cancelled.is_set()):
+                        self.manager._publish(self, self.fractal, data)
+                # Рендерер може уточнити межі області під свою сітку, тому працює з копією
+                view = copy.copy(self.fractal)
+                data = self.renderer.render(view, self.c_real, self.c_imag, on_progress=self._on_progress)
+                self.manager._publish(self, view, data)
+            elif self.progressive:
+                # Грубі проходи показуються одразу, повний результат - останнім
+                for _, data in self.fractal.generate_progressive(self.c_real, self.c_imag,
+                                                                 on_progress=self._on_progress):
+                    self.manager._publish(self, self.fractal, data)
+            else:
+                data = self.fractal.generate(self.c_real, self.c_imag, on_progress=self._on_progress)
+                self.manager._publish(self, self.fractal, data)
+        except RenderCancelled:
+            pass
+        finally:
+            self.manager._finish(self)
+
+
+class RenderManager(QObject):
+    """Запускає обчислення фракталу у фоні та віддає лише результат останнього запиту.
+
+    Кожен запит отримує номер завдання; новий запит скасовує всі попередні, тож
+    застарілі результати ніколи не потрапляють на полотно.
+    """
+
+    progress_changed = Signal(int, int)
+    # (завдання, параметри фракталу, що описують результат, карта ітерацій)
+    result_ready = Signal(object, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        # Один потік: скасоване завдання швидко звільняє його для наступного
+        self.pool.setMaxThreadCount(1)
+        self.latest_job_id = 0
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fractal, c_real, c_imag, renderer=None, progressive=False):
+        """Ставить обчислення у чергу та повертає номер завдання.
+
+        renderer - об'єкт з методом render(fractal, c_real, c_imag, on_progress) замість
+        fractal.generate. Якщо renderer не задано і progressive, результат віддається
+        кілька разів: від грубого до повного.
+        """
+        with self._lock:
+            self.latest_job_id += 1
+            for job in self._jobs.values():
+                job.cancelled.set()
+            # Знімок параметрів: інтерфейс може змінити fractal, поки завдання виконується
+            job = RenderJob(self, self.latest_job_id, copy.copy(fractal), c_real, c_imag,
+                            renderer, progressive)
+            job.setAutoDelete(False)
+            self._jobs[job.job_id] = job
+        self.pool.start(job)
+        return job.job_id
+
+    def cancel_all(self):
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancelled.set()
+
+    def wait(self):
+        self.pool.waitForDone()
+
+    def _publish(self, job, fractal, data):
+        job.compute_time = time.perf_counter() - job.started
+        with self._lock:
+            # Відкидаємо застарілі результати
+            if job.cancelled.is_set() or job.job_id != self.latest_job_id:
+                return
+        self.result_ready.emit(job, fractal, data)
+
+    def _finish(self, job):
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
@@ -0,0 +1,200 @@
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from fractal import RenderCancelled, escape_time, apply_iteration_cutoff
+from kernels import escape_time_jit, resolve_backend
+from hilbert import hilbert_grid_order
+from tiles import STOP_FRACTION
+
+# Кількість рівнів масштабу на кожне подвоєння: крок сітки рівня L дорівнює 2 ** (-L / 4)
+LEVELS_PER_OCTAVE = 4
+
+
+class TileCache:
+    """LRU-кеш плиток з обмеженням за обсягом пам'яті (у байтах)."""
+
+    def __init__(self, max_bytes=256 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._tiles = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def get(self, key):
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._tiles.move_to_end(key)
+            return tile
+
+    def put(self, key, tile):
+        with self._lock:
+            if key in self._tiles:
+                self._bytes -= self._tiles.pop(key).nbytes
+            if tile.nbytes > self.max_bytes:
+                return
+            self._tiles[key] = tile
+            self._bytes += tile.nbytes
+            self._evict()
+
+    def set_max_bytes(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self):
+        # Витісняємо найдавніше використані плитки, доки не вкладемося в бюджет
+        while self._bytes > self.max_bytes:
+            _, old = self._tiles.popitem(last=False)
+            self._bytes -= old.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._tiles.clear()
+            self._bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+            'tiles': len(self._tiles),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+def zoom_level(spacing):
+    """Найменший рівень масштабу, крок сітки якого не більший за spacing."""
+    return math.ceil(-math.log2(spacing) * LEVELS_PER_OCTAVE)
+
+
+def level_spacing(level):
+    return 2.0 ** (-level / LEVELS_PER_OCTAVE)
+
+
+def tile_dtype(fraction_dtype=None):
+    """Тип елементів плитки: номер втечі або, з плавним забарвленням, пара (номер, дробова частина)."""
+    if fraction_dtype is None:
+        return np.dtype(np.int32)
+    return np.dtype([('count', np.int32), ('fraction', fraction_dtype)])
+
+
+class CachedRenderer:
+    """Обчислює фрактал на глобальній сітці плиток і повторно використовує вже обчислені плитки.
+
+    Пікселі прив'язані до сітки k * h (h залежить лише від рівня масштабу), тому при
+    панорамуванні ті самі плитки мають той самий ключ і дораховуються лише нові.
+    Кожна плитка припиняє ітерації, щойно в ній лишається менше STOP_FRACTION активних
+    точок, тож від зображення без кешу результат відрізняється не більше ніж на цю частку пікселів.
+    """
+
+    def __init__(self, cache=None, tile_size=128):
+        self.cache = cache if cache is not None else TileCache()
+        self.tile_size = tile_size
+
+    def _compute_tile(self, level, tx, ty, c, max_iterations, escape_radius, backend, real_dtype,
+                      fraction_dtype, on_iteration):
+        h = level_spacing(level)
+        size = self.tile_size
+        x = ((tx * size + np.arange(size)) * h).astype(real_dtype)
+        y = ((ty * size + np.arange(size)) * h).astype(real_dtype)
+        X, Y = np.meshgrid(x, y)
+        fraction = None if fraction_dtype is None else np.zeros(X.shape, dtype=fraction_dtype)
+        if backend == 'numba':
+            counts = escape_time_jit(X + 1j * Y, c, max_iterations, escape_radius, fraction=fraction,
+                                     on_chunk=lambda done, total: on_iteration(max_iterations * done // total - 1, 0))
+            # Скомпільоване ядро рахує без раннього виходу - правило застосовується до готової плитки
+            apply_iteration_cutoff(counts, STOP_FRACTION)
+        else:
+            # Ранній вихід лише за власними точками плитки, тож її вміст не залежить від області перегляду
+            min_active = size * size * STOP_FRACTION
+            counts = escape_time(X + 1j * Y, c, max_iterations, escape_radius, fraction=fraction,
+                                 on_iteration=lambda i, active: on_iteration(i, active) or active < min_active)
+        if fraction is None:
+            return counts
+        tile = np.empty(counts.shape, dtype=tile_dtype(fraction_dtype))
+        tile['count'] = counts
+        tile['fraction'] = fraction
+        return tile
+
+    def render(self, fractal, c_real, c_imag, on_progress=None):
+        """Повертає нормалізовану карту ітерацій для області перегляду fractal.
+
+        Карта має розмір fractal.height x fractal.width: кожен піксель береться з найближчого
+        пікселя сітки плиток, крок якої не більший за крок зображення.
+        """
+        c = complex(c_real, c_imag)
+        spacing = min((fractal.x_max - fractal.x_min) / max(fractal.width - 1, 1),
+                      (fractal.y_max - fractal.y_min) / max(fractal.height - 1, 1))
+        level = zoom_level(spacing)
+        h = level_spacing(level)
+        size = self.tile_size
+        backend = resolve_backend(fractal.backend)
+        real_dtype = np.dtype(fractal.real_dtype())
+        fraction_dtype = np.dtype(fractal.output_dtype()) if fractal.smooth else None
+
+        # Діапазон пікселів глобальної сітки, що покриває область перегляду
+        kx0, kx1 = math.floor(fractal.x_min / h), math.ceil(fractal.x_max / h)
+        ky0, ky1 = math.floor(fractal.y_min / h), math.ceil(fractal.y_max / h)
+        tx0, tx1 = kx0 // size, kx1 // size
+        ty0, ty1 = ky0 // size, ky1 // size
+
+        mosaic = np.empty(((ty1 - ty0 + 1) * size, (tx1 - tx0 + 1) * size), dtype=tile_dtype(fraction_dtype))
+        missing = []
+        # Плитки обходяться вздовж кривої Гільберта, тож і відсутні обчислюються так,
+        # що сусідні в часі плитки сусідні й у мозаїці
+        for index in hilbert_grid_order(tx1 - tx0 + 1, ty1 - ty0 + 1):
+            dy, dx = divmod(int(index), tx1 - tx0 + 1)
+            tx, ty = tx0 + dx, ty0 + dy
+            key = (c, fractal.max_iterations, fractal.escape_radius, real_dtype, fraction_dtype,
+                   level, tx, ty)
+            tile = self.cache.get(key)
+            if tile is None:
+                missing.append((key, tx, ty))
+            else:
+                mosaic[dy * size:(dy + 1) * size, dx * size:(dx + 1) * size] = tile
+
+        for done, (key, tx, ty) in enumerate(missing):
+            def on_iteration(i, active):
+                if on_progress is not None and on_progress(done * fractal.max_iterations + i + 1,
+                                                           len(missing) * fractal.max_iterations):
+                    raise RenderCancelled()
+                return False
+
+            tile = self._compute_tile(level, tx, ty, c, fractal.max_iterations, fractal.escape_radius,
+                                      backend, real_dtype, fraction_dtype, on_iteration)
+            self.cache.put(key, tile)
+            mosaic[(ty - ty0) * size:(ty - ty0 + 1) * size,
+                   (tx - tx0) * size:(tx - tx0 + 1) * size] = tile
+
+        # Пікселі зображення - найближчі пікселі сітки (номер k у мозаїці - k - t0 * size)
+        x = np.linspace(fractal.x_min, fractal.x_max, fractal.width)
+        y = np.linspace(fractal.y_min, fractal.y_max, fractal.height)
+        columns = np.clip(np.rint(x / h).astype(np.int64), kx0, kx1) - tx0 * size
+        rows = np.clip(np.rint(y / h).astype(np.int64), ky0, ky1) - ty0 * size
+        view = mosaic[np.ix_(rows, columns)]
+        if fraction_dtype is None:
+            result, fraction = view, None
+        else:
+            result, fraction = view['count'].copy(), view['fraction'].copy()
+        apply_iteration_cutoff(result, STOP_FRACTION)
+        return fractal.normalize(result, fraction)
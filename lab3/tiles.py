@@ -0,0 +1,180 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from fractal import RenderCancelled, escape_time, apply_iteration_cutoff
+from hilbert import hilbert_grid_order
+
+# Частка точок, при якій звичайний цикл припиняє ітерації (див. HyperbolicSinusFractal.generate)
+STOP_FRACTION = 0.01
+
+
+def split_into_tiles(width, height, tile_size):
+    """Розбиває зображення на прямокутні плитки (y0, y1, x0, x1)."""
+    return [(y0, min(y0 + tile_size, height), x0, min(x0 + tile_size, width))
+            for y0 in range(0, height, tile_size)
+            for x0 in range(0, width, tile_size)]
+
+
+def _attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _render_tile(task):
+    """Обчислює одну плитку у процесі-виконавці та записує її у спільний буфер."""
+    index, tile_size, view, c, max_iterations, escape_radius, shape, names, real_dtype, fraction_dtype = task
+    height, width = shape
+    x_min, x_max, y_min, y_max = view
+    tiles = split_into_tiles(width, height, tile_size)
+    y0, y1, x0, x1 = tiles[index]
+
+    result_shm, result = _attach(names[0], shape, np.int32)
+    # progress[t] - остання завершена ітерація плитки t (-1, якщо плитка ще не почалась)
+    progress_shm, progress = _attach(names[1], (len(tiles),), np.int64)
+    # history[t, i] - кількість точок плитки t, що не втекли після ітерації i
+    history_shm, history = _attach(names[2], (len(tiles), max_iterations), np.int64)
+    # Дробова частина втечі для плавного забарвлення (лише якщо воно ввімкнене)
+    fraction_shm, fraction = _attach(names[3], shape, fraction_dtype) if fraction_dtype else (None, None)
+    try:
+        sizes = np.array([(t1 - t0) * (u1 - u0) for t0, t1, u0, u1 in tiles])
+        min_active = width * height * STOP_FRACTION
+
+        # Беремо ті самі значення linspace, що й при обчисленні всього зображення,
+        # тому кожен піксель плитки збігається з пікселем повної сітки
+        x = np.linspace(x_min, x_max, width, dtype=real_dtype)[x0:x1]
+        y = np.linspace(y_min, y_max, height, dtype=real_dtype)[y0:y1]
+        X, Y = np.meshgrid(x, y)
+        Z = X + 1j * Y
+
+        def on_iteration(i, active):
+            history[index, i] = active
+            progress[index] = i
+            if active == 0:
+                return True
+            # Верхня оцінка кількості активних точок усього зображення після ітерації i:
+            # для плиток, що відстають, беремо їхнє останнє (не менше) значення.
+            # Інші процеси змінюють progress паралельно, тому всі маски будуються з однієї
+            # копії: кожна плитка потрапляє рівно в одну групу, а history[t, p[t]] уже записано
+            p = progress.copy()
+            done = p >= i
+            started = ~done & (p >= 0)
+            bound = (history[done, i].sum() + history[started, p[started]].sum()
+                     + sizes[p < 0].sum())
+            # Якщо навіть оцінка менша за 1%, звичайний цикл уже зупинився не пізніше i
+            return bound < min_active
+
+        part = None if fraction is None else np.zeros(Z.shape, dtype=fraction_dtype)
+        result[y0:y1, x0:x1] = escape_time(Z, c, max_iterations, escape_radius,
+                                           on_iteration=on_iteration, fraction=part)
+        if part is not None:
+            fraction[y0:y1, x0:x1] = part
+
+        last = progress[index]
+        if history[index, last] == 0:
+            # Плитка без активних точок далі не змінюється
+            history[index, last + 1:] = 0
+            progress[index] = max_iterations - 1
+    finally:
+        del result, progress, history, fraction
+        result_shm.close()
+        progress_shm.close()
+        history_shm.close()
+        if fraction_shm is not None:
+            fraction_shm.close()
+
+
+class TiledRenderer:
+    """Обчислює фрактал sh(z) + c плитками у пулі процесів.
+
+    Результати плиток записуються напряму у спільну пам'ять, тому масиви
+    не серіалізуються між процесами. Результат збігається з HyperbolicSinusFractal.generate.
+    """
+
+    def __init__(self, max_workers=None, tile_size=256):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.tile_size = tile_size
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            # Пул створюється з потоку QThreadPool, тобто в багатопотоковому процесі Qt:
+            # fork скопіював би стан інших потоків (зокрема захоплені блокування), тому
+            # процеси-виконавці запускаються начисто
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def render(self, fractal, c_real, c_imag, on_progress=None):
+        """Повертає нормалізовану карту ітерацій для параметрів fractal.
+
+        on_progress(done, total) викликається після кожної готової плитки; якщо вона повертає True,
+        плитки, що ще не почались, скасовуються і виникає RenderCancelled.
+        """
+        shape = (fractal.height, fractal.width)
+        tiles = split_into_tiles(fractal.width, fractal.height, self.tile_size)
+        max_iterations = fractal.max_iterations
+
+        buffers = [
+            shared_memory.SharedMemory(create=True, size=fractal.width * fractal.height * 4),
+            shared_memory.SharedMemory(create=True, size=len(tiles) * 8),
+            shared_memory.SharedMemory(create=True, size=len(tiles) * max_iterations * 8),
+        ]
+        real_dtype = np.dtype(fractal.real_dtype()).str
+        fraction_dtype = np.dtype(fractal.output_dtype()).str if fractal.smooth else None
+        if fraction_dtype:
+            buffers.append(shared_memory.SharedMemory(
+                create=True, size=fractal.width * fractal.height * np.dtype(fraction_dtype).itemsize))
+        try:
+            progress = np.ndarray((len(tiles),), dtype=np.int64, buffer=buffers[1].buf)
+            progress[:] = -1
+            del progress
+
+            names = tuple(buf.name for buf in buffers)
+            view = (fractal.x_min, fractal.x_max, fractal.y_min, fractal.y_max)
+            c = complex(c_real, c_imag)
+            executor = self._get_executor()
+            # Плитки подаються вздовж кривої Гільберта: сусідні завдання читають і пишуть
+            # сусідні ділянки зображення, а незавершена частина залишається компактною
+            order = hilbert_grid_order(-(-fractal.width // self.tile_size), -(-fractal.height // self.tile_size))
+            futures = [executor.submit(_render_tile, (int(index), self.tile_size, view, c, max_iterations,
+                                                      fractal.escape_radius, shape, names, real_dtype,
+                                                      fraction_dtype))
+                       for index in order]
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    if on_progress is not None and on_progress(done, len(futures)):
+                        raise RenderCancelled()
+            finally:
+                for future in futures:
+                    future.cancel()
+                # Плитки, що вже виконуються, ще пишуть у спільну пам'ять
+                wait(futures)
+
+            # Плитки обчислюються незалежно, тому раннє завершення застосовуємо до всього зображення
+            counts = np.ndarray(shape, dtype=np.int32, buffer=buffers[0].buf).copy()
+            apply_iteration_cutoff(counts, STOP_FRACTION)
+            fraction = None
+            if fraction_dtype:
+                fraction = np.ndarray(shape, dtype=fraction_dtype, buffer=buffers[3].buf).copy()
+        finally:
+            for buf in buffers:
+                buf.close()
+                buf.unlink()
+
+        return fractal.normalize(counts, fraction)